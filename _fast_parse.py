@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Compiled parsing helpers for ShopBot imports.
+
+Numba is optional. Without it, NUMBA_AVAILABLE is False and DataManager
+keeps using its pandas code path.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Longer digit runs are left to pandas so float rounding matches pd.to_numeric
+MAX_PRICE_DIGITS = 15
+
+def _parse_prices_kernel(buf, offsets, out, valid):
+    """
+    Parses the first price of each "13.990 ; 8990" style string.
+
+    Spaces and dots are skipped and parsing stops at the first ';'. A string
+    is marked invalid if it has no digits or contains any other character.
+    """
+    for i in range(offsets.shape[0] - 1):
+        value = 0.0
+        digits = 0
+        ok = True
+        for j in range(offsets[i], offsets[i + 1]):
+            c = buf[j]
+            if c == 59:  # ';'
+                break
+            if c == 32 or c == 46:  # ' ' or '.'
+                continue
+            if 48 <= c <= 57:
+                value = value * 10.0 + (c - 48)
+                digits += 1
+            else:
+                ok = False
+                break
+        out[i] = value
+        valid[i] = ok and 0 < digits <= MAX_PRICE_DIGITS
+
+if NUMBA_AVAILABLE:
+    _parse_prices_kernel = njit(cache=True)(_parse_prices_kernel)
+
+def parse_prices(strings):
+    """
+    Parses prices from a list of stripped price strings.
+
+    Args:
+        strings (list): Price strings like "13.990 ; 8990"
+
+    Returns:
+        tuple: (float64 array of prices, bool array marking which were parsed)
+    """
+    encoded = [s.encode('utf-8') for s in strings]
+
+    # One flat byte buffer plus start offsets, so the kernel never touches Python objects
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+
+    out = np.zeros(len(encoded), dtype=np.float64)
+    valid = np.zeros(len(encoded), dtype=np.bool_)
+    _parse_prices_kernel(buf, offsets, out, valid)
+
+    return out, valid
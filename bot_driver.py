@@ -17,20 +17,260 @@ Usage:
 """
 
 import asyncio
+import atexit
+import functools
 import json
+import logging
+import mmap
 import os
+import queue
+import random
+import sys
+import threading
 import time
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # Playwright imports (will be installed separately)
 try:
     from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
+    PlaywrightTimeoutError = TimeoutError
     print("⚠️ Playwright not installed. Run: pip install playwright")
 
+# Logging goes through a queue so formatting and console writes happen on a
+# background thread instead of blocking the event loop
+log = logging.getLogger('shopbot.bot')
+_log_listener = None
+
+def setup_logging(level=logging.INFO):
+    """
+    Sets up non-blocking console logging for the bot.
+    
+    Meant for entry points (main.py, running this module directly): it stops
+    bot messages from propagating to the root logger. Applications with their
+    own logging configuration should skip it. Safe to call more than once;
+    only the first call installs the handlers.
+    
+    Args:
+        level: Logging level name or number (e.g. "INFO")
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    log_queue = queue.Queue(-1)
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter('%(message)s'))
+    
+    log.addHandler(QueueHandler(log_queue))
+    log.setLevel(level)
+    log.propagate = False
+    
+    _log_listener = QueueListener(log_queue, console)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # Flush pending messages on exit
+
+# uvloop is optional - a faster event loop for the Playwright traffic (Linux/macOS only).
+# It is only used for loops this module creates; the global event loop policy
+# is left alone for the host application.
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+def _new_event_loop():
+    """Creates an event loop, backed by uvloop when it is installed"""
+    return uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+
+# A Cython build (build_fast.py) is imported ahead of bot_driver.py, so edits
+# to the source are ignored until it is rebuilt - say so instead of staying silent
+_SOURCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bot_driver.py')
+if (not __file__.endswith('.py') and os.path.exists(_SOURCE_PATH)
+        and os.path.getmtime(_SOURCE_PATH) > os.path.getmtime(__file__)):
+    print("⚠️ Compiled bot_driver is older than bot_driver.py and ignores your edits.")
+    print("   Rebuild: python build_fast.py build_ext --inplace")
+    print("   Or remove it: python build_fast.py clean")
+
+# Common login form selectors (customize for your site).
+# Each is a selector list so Playwright matches any alternative in one query.
+USERNAME_SELECTOR = 'input[name="username"], input[name="email"], input[type="email"], #username, #email'
+PASSWORD_SELECTOR = 'input[name="password"], input[type="password"], #password'
+SUBMIT_SELECTOR = 'button[type="submit"], input[type="submit"], button:has-text("Login"), button:has-text("Sign in")'
+
+# Success indicators shown after a product is saved (customize for your site).
+# One selector list waits on all of them at once instead of one after another.
+SUCCESS_SELECTOR = ':text-is("Product created successfully"), :text-is("Product saved"), .success-message, .alert-success'
+
+# Product creation page (customize for your site)
+NEW_PRODUCT_URL = "https://example-shop.com/admin/products/new"
+
+# Product form text fields (customize selectors for your site)
+PRODUCT_FORM_FIELDS = {
+    'name': 'input[name="name"]',
+    'sku': 'input[name="sku"]',
+    'price': 'input[name="price"]',
+    'description': 'textarea[name="description"]'
+}
+
+# Sets every text field of the product form in one round trip. Values go
+# through the element's native setter and fire input/change events so
+# framework-controlled inputs pick them up. Returns selectors not found.
+FILL_FORM_JS = """
+    (fields) => {
+        const missing = [];
+        for (const [selector, value] of Object.entries(fields)) {
+            const el = document.querySelector(selector);
+            if (!el) {
+                missing.push(selector);
+                continue;
+            }
+            const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+            setter.call(el, value);
+            el.dispatchEvent(new Event('input', { bubbles: true }));
+            el.dispatchEvent(new Event('change', { bubbles: true }));
+        }
+        return missing;
+    }
+"""
+
+# Re-enters "new product" mode without a reload: push the form URL through the
+# History API (SPA routers listen for popstate) and clear any leftover input
+RESET_FORM_JS = """
+    (url) => {
+        if (location.pathname !== new URL(url).pathname) {
+            history.pushState({}, '', url);
+            window.dispatchEvent(new PopStateEvent('popstate', { state: {} }));
+        }
+        document.querySelectorAll('form').forEach(form => form.reset());
+    }
+"""
+
+# True when none of the given fields hold a value. form.reset() restores an edit
+# form to the saved product's values, so a non-empty field means the page is
+# not a fresh "new product" form
+FORM_EMPTY_JS = """
+    (selectors) => selectors.every(selector => {
+        const el = document.querySelector(selector);
+        return !el || el.value === '';
+    })
+"""
+
+# Description files at least this large are read through mmap
+MMAP_MIN_DESCRIPTION_BYTES = 4096
+
+# Extracts the admin product list as columns (customize for your site's HTML).
+# The first row is probed once to find which child cell holds each field, so
+# other rows are read by child index; a row whose cell doesn't carry the
+# expected class (template change) falls back to a querySelector lookup.
+EXTRACT_PRODUCTS_JS = """
+    () => {
+        const fields = ['sku', 'name', 'price', 'status'];
+        const rows = [...document.querySelectorAll('.product-row')];
+        const columns = { sku: [], name: [], price: [], status: [] };
+        if (!rows.length) {
+            return columns;
+        }
+        
+        const probe = [...rows[0].children];
+        const index = {};
+        fields.forEach(field => {
+            index[field] = probe.findIndex(cell => cell.classList.contains(field));
+        });
+        
+        const text = (row, field) => {
+            const cell = row.children[index[field]];
+            if (cell && cell.classList.contains(field)) {
+                return cell.textContent.trim();
+            }
+            return row.querySelector('.' + field)?.textContent?.trim();
+        };
+        
+        rows.forEach(row => {
+            const sku = text(row, 'sku');
+            if (!sku) {
+                return;
+            }
+            columns.sku.push(sku);
+            columns.name.push(text(row, 'name'));
+            columns.price.push(text(row, 'price'));
+            columns.status.push(text(row, 'status'));
+        });
+        
+        return columns;
+    }
+"""
+
+@functools.lru_cache(maxsize=1024)
+def _read_desc_cached(path):
+    """
+    Reads a product description file, caching the text per path.
+    
+    Args:
+        path (str): Path to the description file
+        
+    Returns:
+        str: File contents
+        
+    Raises:
+        FileNotFoundError: If the file does not exist. Misses are not cached,
+            so a description added later in the session is still picked up.
+    """
+    # Small files aren't worth the mmap setup cost
+    if os.path.getsize(path) < MMAP_MIN_DESCRIPTION_BYTES:
+        return Path(path).read_text(encoding='utf-8')
+    
+    # Large descriptions are decoded straight from the page cache
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].decode('utf-8')
+
+def _list_dir(path):
+    """
+    Lists the file names in a directory with a single directory read.
+    
+    Args:
+        path (str): Directory to list
+        
+    Returns:
+        set: Names of entries in the directory (empty if it doesn't exist)
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+def _resolve_images(product):
+    """
+    Resolves which of a product's image files exist on disk.
+    
+    Args:
+        product (dict): Product data with image information
+        
+    Returns:
+        tuple: (main image path or None, list of extra image paths)
+    """
+    image_folder = f"data/products/{product['sku']}"
+    present = _list_dir(image_folder)
+    
+    main_image_path = None
+    if product.get('main_image_filename') in present:
+        main_image_path = os.path.join(image_folder, product['main_image_filename'])
+    
+    extra_image_paths = []
+    if product.get('extra_image_filenames'):
+        extra_image_paths = [os.path.join(image_folder, image_name)
+                             for image_name in json.loads(product['extra_image_filenames'])
+                             if image_name in present]
+    
+    return main_image_path, extra_image_paths
+
 class BotDriver:
     """
     Manages web automation for the ShopBot application.
@@ -38,13 +278,15 @@ class BotDriver:
     Handles browser control, login, and product management on e-commerce sites.
     """
     
-    def __init__(self, chrome_profile_path="chrome_profile", headless=False):
+    def __init__(self, chrome_profile_path="chrome_profile", headless=False, concurrent_uploads=2):
         """
         Initialize the BotDriver with browser settings.
         
         Args:
             chrome_profile_path (str): Path to Chrome user profile
             headless (bool): Whether to run browser in headless mode
+            concurrent_uploads (int): Products uploaded at once
+                (sync.concurrent_uploads in config.json)
         """
         self.chrome_profile_path = chrome_profile_path
         self.headless = headless
@@ -54,14 +296,16 @@ class BotDriver:
         self.page = None
         self.is_connected = False
         self.login_status = False
+        self._form_locators = {}  # Product form locators per upload page
         
         # Configuration
         self.timeout = 30000  # 30 seconds
         self.retry_attempts = 3
+        self.concurrent_uploads = max(1, int(concurrent_uploads))
         
-        print(f"🤖 BotDriver initialized")
-        print(f"   Profile: {chrome_profile_path}")
-        print(f"   Headless: {headless}")
+        log.info("🤖 BotDriver initialized")
+        log.info(f"   Profile: {chrome_profile_path}")
+        log.info(f"   Headless: {headless}")
     
     async def connect_to_browser(self):
         """
@@ -71,11 +315,11 @@ class BotDriver:
             bool: True if connection successful
         """
         if not PLAYWRIGHT_AVAILABLE:
-            print("❌ Cannot connect - Playwright not available")
+            log.error("❌ Cannot connect - Playwright not available")
             return False
         
         try:
-            print("🚀 Starting browser connection...")
+            log.info("🚀 Starting browser connection...")
             
             # Create profile directory if it doesn't exist
             os.makedirs(self.chrome_profile_path, exist_ok=True)
@@ -88,6 +332,7 @@ class BotDriver:
                 user_data_dir=self.chrome_profile_path,
                 headless=self.headless,
                 viewport={'width': 1920, 'height': 1080},
+                service_workers='allow',  # Keep cached admin JS bundles between runs
                 args=[
                     '--no-sandbox',
                     '--disable-blink-features=AutomationControlled',
@@ -103,12 +348,12 @@ class BotDriver:
             self.page.set_default_timeout(self.timeout)
             
             self.is_connected = True
-            print("✅ Browser connected successfully")
+            log.info("✅ Browser connected successfully")
             
             return True
             
         except Exception as e:
-            print(f"❌ Browser connection failed: {e}")
+            log.error(f"❌ Browser connection failed: {e}")
             await self.disconnect()
             return False
     
@@ -125,11 +370,11 @@ class BotDriver:
             bool: True if login successful
         """
         if not self.is_connected:
-            print("❌ Cannot login - browser not connected")
+            log.error("❌ Cannot login - browser not connected")
             return False
         
         try:
-            print(f"🔐 Attempting login for user: {username}")
+            log.info(f"🔐 Attempting login for user: {username}")
             
             # Use provided URL or default
             if not login_url:
@@ -137,96 +382,44 @@ class BotDriver:
             
             # Navigate to login page
             await self.page.goto(login_url)
-            print(f"📍 Navigated to: {login_url}")
+            log.info(f"📍 Navigated to: {login_url}")
             
-            # Wait for login form to load
-            await self.page.wait_for_load_state('networkidle')
-            
-            # Common login form selectors (customize for your site)
-            username_selectors = [
-                'input[name="username"]',
-                'input[name="email"]', 
-                'input[type="email"]',
-                '#username',
-                '#email'
-            ]
-            
-            password_selectors = [
-                'input[name="password"]',
-                'input[type="password"]',
-                '#password'
-            ]
-            
-            submit_selectors = [
-                'button[type="submit"]',
-                'input[type="submit"]',
-                'button:has-text("Login")',
-                'button:has-text("Sign in")'
-            ]
+            # Wait for login form to load (the field waits below cover late rendering)
+            await self.page.wait_for_load_state('domcontentloaded')
             
             # Find and fill username
-            username_filled = False
-            for selector in username_selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    await self.page.fill(selector, username)
-                    print(f"✅ Username filled using: {selector}")
-                    username_filled = True
-                    break
-                except:
-                    continue
-            
-            if not username_filled:
-                print("❌ Could not find username field")
-                return False
+            username_field = self.page.locator(USERNAME_SELECTOR).first
+            await username_field.wait_for(state="visible", timeout=self.timeout)
+            await username_field.fill(username)
+            log.info("✅ Username filled")
             
             # Find and fill password
-            password_filled = False
-            for selector in password_selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    await self.page.fill(selector, password)
-                    print(f"✅ Password filled using: {selector}")
-                    password_filled = True
-                    break
-                except:
-                    continue
-            
-            if not password_filled:
-                print("❌ Could not find password field")
-                return False
+            password_field = self.page.locator(PASSWORD_SELECTOR).first
+            await password_field.wait_for(state="visible", timeout=self.timeout)
+            await password_field.fill(password)
+            log.info("✅ Password filled")
             
             # Find and click submit button
-            submit_clicked = False
-            for selector in submit_selectors:
-                try:
-                    await self.page.wait_for_selector(selector, timeout=5000)
-                    await self.page.click(selector)
-                    print(f"✅ Submit clicked using: {selector}")
-                    submit_clicked = True
-                    break
-                except:
-                    continue
-            
-            if not submit_clicked:
-                print("❌ Could not find submit button")
-                return False
+            submit_button = self.page.locator(SUBMIT_SELECTOR).first
+            await submit_button.wait_for(state="visible", timeout=self.timeout)
+            await submit_button.click()
+            log.info("✅ Submit clicked")
             
-            # Wait for navigation after login
+            # Wait for navigation after login - networkidle lets the redirect chain settle
             await self.page.wait_for_load_state('networkidle')
             
             # Check if login was successful (customize this check)
             current_url = self.page.url
             if 'login' not in current_url.lower():
                 self.login_status = True
-                print("✅ Login successful!")
+                log.info("✅ Login successful!")
                 return True
             else:
-                print("❌ Login failed - still on login page")
+                log.error("❌ Login failed - still on login page")
                 return False
                 
         except Exception as e:
-            print(f"❌ Login error: {e}")
+            log.error(f"❌ Login error: {e}")
             return False
     
     async def upload_new_products(self, products_to_upload):
@@ -240,105 +433,221 @@ class BotDriver:
             dict: Upload results with success/failure counts
         """
         if not self.is_connected or not self.login_status:
-            print("❌ Cannot upload - not connected or not logged in")
+            log.error("❌ Cannot upload - not connected or not logged in")
             return {'success': 0, 'failed': 0, 'errors': []}
         
-        print(f"📤 Starting upload of {len(products_to_upload)} products...")
+        log.info(f"📤 Starting upload of {len(products_to_upload)} products...")
         
         results = {'success': 0, 'failed': 0, 'errors': []}
         
-        for i, product in enumerate(products_to_upload, 1):
+        # Each upload runs on its own page; the semaphore bounds how many
+        # pages are open against the site at the same time. Pages that finish
+        # cleanly are parked in idle_pages and reused by the next upload.
+        sem = asyncio.Semaphore(self.concurrent_uploads)
+        idle_pages = []
+        outcomes = await asyncio.gather(
+            *[self._upload_one(product, sem, idle_pages) for product in products_to_upload],
+            return_exceptions=True
+        )
+        
+        for page in idle_pages:
+            await self._close_upload_page(page)
+        
+        for product, outcome in zip(products_to_upload, outcomes):
+            if isinstance(outcome, Exception):
+                outcome = f"Upload failed for {product.get('sku', 'unknown')}: {outcome}"
+            
+            if outcome is None:
+                results['success'] += 1
+            else:
+                results['failed'] += 1
+                results['errors'].append(outcome)
+        
+        log.info(f"📊 Upload complete: {results['success']} success, {results['failed']} failed")
+        return results
+    
+    async def _upload_one(self, product, sem, idle_pages):
+        """
+        Uploads a single product on a dedicated page.
+        
+        Args:
+            product (dict): Product data
+            sem (asyncio.Semaphore): Limits the number of concurrent uploads
+            idle_pages (list): Pages left by earlier successful uploads, shared
+                between uploads so they can be reused without a reload
+            
+        Returns:
+            str: Error message, or None if upload successful
+        """
+        async with sem:
+            page = idle_pages.pop() if idle_pages else None
+            reuse = page is not None
             try:
-                print(f"📦 Uploading product {i}/{len(products_to_upload)}: {product.get('product_name', 'Unknown')}")
+                log.info(f"📦 Uploading product: {product.get('product_name', 'Unknown')}")
+                
+                if page is None:
+                    page = await self.context.new_page()
+                    page.set_default_timeout(self.timeout)
+                    self._bind_form_locators(page)
                 
                 # Navigate to product creation page
-                await self.page.goto("https://example-shop.com/admin/products/new")
-                await self.page.wait_for_load_state('networkidle')
+                await self._open_product_form(page, reuse)
                 
                 # Fill product form (customize selectors for your site)
-                await self._fill_product_form(product)
+                await self._fill_product_form(page, product)
                 
                 # Upload images if available
                 if product.get('has_image'):
-                    await self._upload_product_images(product)
+                    await self._upload_product_images(page, product)
                 
                 # Submit product
-                await self.page.click('button[type="submit"]')
-                await self.page.wait_for_load_state('networkidle')
+                await self._form_locators[page]['submit'].click()
+                await page.wait_for_load_state('domcontentloaded')
                 
                 # Check if upload was successful
-                if await self._verify_product_upload():
-                    results['success'] += 1
-                    print(f"✅ Product uploaded successfully")
-                else:
-                    results['failed'] += 1
-                    results['errors'].append(f"Upload verification failed for {product.get('sku', 'unknown')}")
+                if not await self._verify_product_upload(page):
+                    return f"Upload verification failed for {product.get('sku', 'unknown')}"
+                
+                log.info(f"✅ Product uploaded successfully: {product.get('sku', 'unknown')}")
                 
-                # Small delay between uploads
-                await asyncio.sleep(2)
+                # Small jittered delay so concurrent uploads don't hit the site in lockstep
+                await asyncio.sleep(random.uniform(0.2, 0.8))
+                
+                # Hand the page on to the next upload; failed pages are closed
+                # so their replacement starts with a full navigation
+                idle_pages.append(page)
+                page = None
+                
+                return None
                 
             except Exception as e:
-                results['failed'] += 1
                 error_msg = f"Upload failed for {product.get('sku', 'unknown')}: {e}"
-                results['errors'].append(error_msg)
-                print(f"❌ {error_msg}")
+                log.error(f"❌ {error_msg}")
+                return error_msg
+            
+            finally:
+                if page:
+                    await self._close_upload_page(page)
+    
+    def _bind_form_locators(self, page):
+        """
+        Creates the product form locators for a page once, so the upload
+        helpers don't rebuild them from selector strings for every product.
+        Text fields are written by FILL_FORM_JS; only the name field is kept
+        here to detect when the form has rendered.
         
-        print(f"📊 Upload complete: {results['success']} success, {results['failed']} failed")
-        return results
+        Locators are resolved lazily, so they stay valid across navigations
+        on the same page.
+        
+        Args:
+            page (Page): Page that will hold the product form
+        """
+        self._form_locators[page] = {
+            'name': page.locator(PRODUCT_FORM_FIELDS['name']),
+            'main_image': page.locator('input[type="file"][name="main_image"]'),
+            'extra_images': page.locator('input[type="file"][name="extra_images"]'),
+            'submit': page.locator('button[type="submit"]')
+        }
     
-    async def _fill_product_form(self, product):
+    async def _close_upload_page(self, page):
+        """
+        Closes an upload page and drops its form locators.
+        
+        Args:
+            page (Page): Page to close
+        """
+        self._form_locators.pop(page, None)
+        await page.close()
+    
+    async def _open_product_form(self, page, reuse):
+        """
+        Brings a page to an empty "new product" form.
+        
+        A reused page is reset in place through the admin's client-side router,
+        avoiding a full page load. The reset only counts if the form is visible
+        with empty name and SKU fields and the previous product's success
+        indicator is gone; otherwise (e.g. the admin is not a single-page app and
+        still shows the saved product's edit form) it falls back to a normal
+        navigation, so the next product is never submitted over the last one.
+        
+        Args:
+            page (Page): Page to prepare
+            reuse (bool): True if the page already holds a loaded admin page
+        """
+        if reuse:
+            try:
+                await page.evaluate(RESET_FORM_JS, NEW_PRODUCT_URL)
+                await self._form_locators[page]['name'].wait_for(state="visible", timeout=2000)
+                # pushState already changed page.url, so check the fields instead
+                empty_fields = [PRODUCT_FORM_FIELDS['name'], PRODUCT_FORM_FIELDS['sku']]
+                if await page.evaluate(FORM_EMPTY_JS, empty_fields):
+                    # A leftover success message would let _verify_product_upload
+                    # pass without the next submit doing anything
+                    await page.locator(SUCCESS_SELECTOR).first.wait_for(state="detached", timeout=2000)
+                    return
+            except Exception:
+                pass
+        
+        await page.goto(NEW_PRODUCT_URL)
+        await page.wait_for_load_state('domcontentloaded')
+        await self._form_locators[page]['name'].wait_for(state="visible")
+    
+    async def _fill_product_form(self, page, product):
         """
         Helper method to fill product form fields.
         
         Args:
+            page (Page): Page holding the product form
             product (dict): Product data
         """
-        # Product name
-        await self.page.fill('input[name="name"]', product.get('product_name', ''))
-        
-        # SKU
-        await self.page.fill('input[name="sku"]', product.get('sku', ''))
+        # Product name and SKU
+        values = {
+            'name': product.get('product_name', ''),
+            'sku': product.get('sku', '')
+        }
         
         # Price
         if product.get('price'):
-            await self.page.fill('input[name="price"]', str(product['price']))
+            values['price'] = str(product['price'])
         
         # Description
         if product.get('description_filename'):
-            description = await self._load_product_description(product)
-            await self.page.fill('textarea[name="description"]', description)
+            values['description'] = await self._load_product_description(product)
+        
+        # Write all text fields with a single evaluate call
+        fields = {PRODUCT_FORM_FIELDS[field]: value for field, value in values.items()}
+        missing = await page.evaluate(FILL_FORM_JS, fields)
+        if missing:
+            raise Exception(f"Product form fields not found: {', '.join(missing)}")
         
         # Category (this would need site-specific implementation)
         if product.get('category_path'):
             await self._select_category(product['category_path'])
     
-    async def _upload_product_images(self, product):
+    async def _upload_product_images(self, page, product):
         """
         Helper method to upload product images.
         
         Args:
+            page (Page): Page holding the product form
             product (dict): Product data with image information
         """
         try:
-            # Construct image path
-            image_folder = f"data/products/{product['sku']}"
-            
-            if product.get('main_image_filename'):
-                main_image_path = os.path.join(image_folder, product['main_image_filename'])
-                if os.path.exists(main_image_path):
-                    # Upload main image
-                    await self.page.set_input_files('input[type="file"][name="main_image"]', main_image_path)
-            
-            # Upload additional images if available
-            if product.get('extra_image_filenames'):
-                extra_images = json.loads(product['extra_image_filenames'])
-                for image_name in extra_images:
-                    image_path = os.path.join(image_folder, image_name)
-                    if os.path.exists(image_path):
-                        await self.page.set_input_files('input[type="file"][name="extra_images"]', image_path)
+            # Resolve image paths off the event loop (stat calls can block on slow disks)
+            main_image_path, extra_image_paths = await asyncio.to_thread(_resolve_images, product)
+            
+            form = self._form_locators[page]
+            
+            if main_image_path:
+                # Upload main image
+                await form['main_image'].set_input_files(main_image_path)
+            
+            # Upload additional images in a single call
+            if extra_image_paths:
+                await form['extra_images'].set_input_files(extra_image_paths)
         
         except Exception as e:
-            print(f"⚠️ Image upload error: {e}")
+            log.warning(f"⚠️ Image upload error: {e}")
     
     async def _load_product_description(self, product):
         """
@@ -352,11 +661,12 @@ class BotDriver:
         """
         try:
             desc_path = f"data/products/{product['sku']}/{product['description_filename']}"
-            if os.path.exists(desc_path):
-                with open(desc_path, 'r', encoding='utf-8') as f:
-                    return f.read()
+            # Cold reads run off the event loop; repeat reads are served from the cache
+            return await asyncio.to_thread(_read_desc_cached, desc_path)
+        except FileNotFoundError:
+            pass
         except Exception as e:
-            print(f"⚠️ Description load error: {e}")
+            log.warning(f"⚠️ Description load error: {e}")
         
         return ""
     
@@ -368,86 +678,69 @@ class BotDriver:
             category_path (str): Category path like "Természet/Virágok"
         """
         # This would need to be customized for your specific site's category system
-        print(f"📂 Setting category: {category_path}")
+        log.info(f"📂 Setting category: {category_path}")
         # Implementation would depend on the site's category selection UI
     
-    async def _verify_product_upload(self):
+    async def _verify_product_upload(self, page):
         """
         Verifies that product upload was successful.
         
+        Args:
+            page (Page): Page the product was submitted from
+        
         Returns:
             bool: True if upload successful
         """
         try:
-            # Look for success indicators (customize for your site)
-            success_indicators = [
-                'text="Product created successfully"',
-                'text="Product saved"',
-                '.success-message',
-                '.alert-success'
-            ]
-            
-            for indicator in success_indicators:
-                try:
-                    await self.page.wait_for_selector(indicator, timeout=5000)
-                    return True
-                except:
-                    continue
+            # Wait for whichever success indicator appears first
+            await page.locator(SUCCESS_SELECTOR).first.wait_for(timeout=5000)
+            return True
             
+        except PlaywrightTimeoutError:
             return False
             
         except Exception as e:
-            print(f"⚠️ Upload verification error: {e}")
+            log.warning(f"⚠️ Upload verification error: {e}")
             return False
     
     async def download_new_products(self):
         """
         Downloads/syncs products from the e-commerce site.
         
+        Products are returned column-wise, so callers can build a table in
+        one step with pd.DataFrame(products).
+        
         Returns:
-            list: List of downloaded product data
+            dict: Lists of 'sku', 'name', 'price' and 'status' values, one entry per product
         """
+        empty = {'sku': [], 'name': [], 'price': [], 'status': []}
+        
         if not self.is_connected or not self.login_status:
-            print("❌ Cannot download - not connected or not logged in")
-            return []
+            log.error("❌ Cannot download - not connected or not logged in")
+            return empty
         
-        print("📥 Starting product download from site...")
+        log.info("📥 Starting product download from site...")
         
         try:
             # Navigate to products list
             await self.page.goto("https://example-shop.com/admin/products")
-            await self.page.wait_for_load_state('networkidle')
+            await self.page.wait_for_load_state('domcontentloaded')
+            
+            # Product rows may be rendered client-side after the DOM is ready
+            try:
+                await self.page.locator('.product-row').first.wait_for(state="attached", timeout=5000)
+            except Exception:
+                pass  # No rows - the extractor below returns empty columns
+            
+            # Extract product data from the page as columns rather than row objects
+            products = await self.page.evaluate(EXTRACT_PRODUCTS_JS)
             
-            # Extract product data from the page
-            products = await self.page.evaluate("""
-                () => {
-                    // This would need to be customized for your site's HTML structure
-                    const productRows = document.querySelectorAll('.product-row');
-                    const products = [];
-                    
-                    productRows.forEach(row => {
-                        const product = {
-                            sku: row.querySelector('.sku')?.textContent?.trim(),
-                            name: row.querySelector('.name')?.textContent?.trim(),
-                            price: row.querySelector('.price')?.textContent?.trim(),
-                            status: row.querySelector('.status')?.textContent?.trim()
-                        };
-                        
-                        if (product.sku) {
-                            products.push(product);
-                        }
-                    });
-                    
-                    return products;
-                }
-            """)
-            
-            print(f"✅ Downloaded {len(products)} products from site")
+            log.info(f"✅ Downloaded {len(products['sku'])} products from site")
             return products
             
         except Exception as e:
-            print(f"❌ Download error: {e}")
-            return []
+            log.error(f"❌ Download error: {e}")
+            return empty
     
     async def get_browser_status(self):
         """
@@ -479,10 +772,10 @@ class BotDriver:
         
         try:
             await self.page.screenshot(path=path)
-            print(f"📸 Screenshot saved: {path}")
+            log.info(f"📸 Screenshot saved: {path}")
             return True
         except Exception as e:
-            print(f"❌ Screenshot error: {e}")
+            log.error(f"❌ Screenshot error: {e}")
             return False
     
     async def disconnect(self):
@@ -490,7 +783,7 @@ class BotDriver:
         Disconnects from the browser and cleans up resources.
         """
         try:
-            print("🔌 Disconnecting from browser...")
+            log.info("🔌 Disconnecting from browser...")
             
             if self.context:
                 await self.context.close()
@@ -505,10 +798,10 @@ class BotDriver:
             self.browser = None
             self.playwright = None
             
-            print("✅ Browser disconnected successfully")
+            log.info("✅ Browser disconnected successfully")
             
         except Exception as e:
-            print(f"⚠️ Disconnect error: {e}")
+            log.warning(f"⚠️ Disconnect error: {e}")
 
 # Synchronous wrapper for easier use
 class BotDriverSync:
@@ -516,19 +809,31 @@ class BotDriverSync:
     Synchronous wrapper for BotDriver to make it easier to use in GUI applications.
     """
     
-    def __init__(self, chrome_profile_path="chrome_profile", headless=False):
-        self.bot = BotDriver(chrome_profile_path, headless)
+    def __init__(self, chrome_profile_path="chrome_profile", headless=False, concurrent_uploads=2):
+        self.bot = BotDriver(chrome_profile_path, headless, concurrent_uploads)
         self.loop = None
+        self._loop_thread = None
+        self._start_loop()
+    
+    def _start_loop(self):
+        """
+        Starts an event loop on a background thread.
+        
+        The loop stays running between calls so the Playwright connection
+        stays live, and is only stopped by disconnect().
+        """
+        self.loop = _new_event_loop()
+        self._loop_thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self._loop_thread.start()
     
     def _run_async(self, coro):
         """
-        Runs an async coroutine in the event loop.
+        Runs an async coroutine on the background event loop and waits for its result.
         """
-        if self.loop is None:
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
+        if not self._loop_thread.is_alive():
+            self._start_loop()
         
-        return self.loop.run_until_complete(coro)
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
     
     def connect_to_browser(self):
         return self._run_async(self.bot.connect_to_browser())
@@ -549,7 +854,14 @@ class BotDriverSync:
         return self._run_async(self.bot.take_screenshot(path))
     
     def disconnect(self):
-        return self._run_async(self.bot.disconnect())
+        result = self._run_async(self.bot.disconnect())
+        
+        # Shut down the background loop
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._loop_thread.join()
+        self.loop.close()
+        
+        return result
 
 # Test the BotDriver if run directly
 if __name__ == "__main__":
@@ -583,12 +895,19 @@ if __name__ == "__main__":
         await bot.disconnect()
     
     if PLAYWRIGHT_AVAILABLE:
-        asyncio.run(test_bot())
+        setup_logging()
+        loop = _new_event_loop()
+        try:
+            loop.run_until_complete(test_bot())
+        finally:
+            loop.close()
         print("\n✅ BotDriver test complete!")
         print("\nNext steps:")
         print("1. Install Playwright: pip install playwright")
         print("2. Install browsers: playwright install chromium")
         print("3. Customize login/upload methods for your e-commerce site")
+        if not UVLOOP_AVAILABLE:
+            print("4. Optional (Linux/macOS): pip install uvloop for a faster event loop")
     else:
         print("\n⚠️ Cannot test - Playwright not installed")
         print("Run: pip install playwright && playwright install chromium")
@@ -4,10 +4,53 @@ Create Sample Data Structure for ShopBot
 Creates folders, sample images, and Excel file for testing.
 """
 
+import importlib.util
 import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
 from PIL import Image
 import random
+import shutil
+
+# Template images shared by all sample products, one pair per color
+PALETTE_DIR = 'data/_palette'
+
+# simplejpeg is optional - libjpeg-turbo SIMD encoding, much faster than Pillow's default path
+try:
+    from simplejpeg import encode_jpeg
+    SIMPLEJPEG_AVAILABLE = True
+except ImportError:
+    SIMPLEJPEG_AVAILABLE = False
+
+# xlsxwriter is optional - it writes the sample workbook faster than openpyxl
+EXCEL_ENGINE = 'xlsxwriter' if importlib.util.find_spec('xlsxwriter') else 'openpyxl'
+
+# Numba is optional - it speeds up the dot pattern for large/many images
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True)
+    def _paint_dots(arr, step=50, size=10):
+        """Paints white dots on every other grid cell, one tile row per thread"""
+        for row in prange((arr.shape[0] + step - 1) // step):
+            ty = row * step
+            for tx in range(0, arr.shape[1], step):
+                if (tx + ty) % (2 * step) == 0:
+                    arr[ty:ty + size, tx:tx + size, :] = 255
+
+    # Warm up the JIT so the first real image doesn't pay compilation cost
+    _paint_dots(np.zeros((1, 1, 3), dtype=np.uint8))
+else:
+    def _paint_dots(arr, step=50, size=10):
+        """Paints white dots on every other grid cell using a boolean mask"""
+        ys, xs = np.ogrid[0:arr.shape[0], 0:arr.shape[1]]
+        dots = (ys % step < size) & (xs % step < size) & ((ys // step + xs // step) % 2 == 0)
+        arr[dots] = 255
 
 def create_sample_image(filepath, width=800, height=600, color=None):
     """Creates a simple colored rectangle image"""
@@ -15,21 +58,77 @@ def create_sample_image(filepath, width=800, height=600, color=None):
         # Random color
         color = (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
 
-    # Create image
-    img = Image.new('RGB', (width, height), color)
+    # Create image as a solid color array
+    arr = np.full((height, width, 3), color, dtype=np.uint8)
 
-    # Add some simple pattern
-    pixels = img.load()
-    for i in range(0, width, 50):
-        for j in range(0, height, 50):
-            if (i + j) % 100 == 0:
-                for x in range(i, min(i+10, width)):
-                    for y in range(j, min(j+10, height)):
-                        pixels[x, y] = (255, 255, 255)  # White dots
+    # Add some simple pattern: 10x10 white dots on every other 50px grid cell
+    _paint_dots(arr)
 
-    img.save(filepath)
+    # Throwaway sample data: skip Huffman optimization, use 4:2:0 subsampling
+    if SIMPLEJPEG_AVAILABLE:
+        with open(filepath, 'wb') as f:
+            f.write(encode_jpeg(arr, quality=75, colorspace='RGB', colorsubsampling='420'))
+    else:
+        Image.fromarray(arr, 'RGB').save(filepath, 'JPEG', quality=75, optimize=False, subsampling=2)
     print(f"✅ Created image: {filepath}")
 
+def _palette_paths(color_index):
+    """Returns the (main, extra) template image paths for a palette color"""
+    return (f'{PALETTE_DIR}/img_{color_index}_main.jpg',
+            f'{PALETTE_DIR}/img_{color_index}_extra.jpg')
+
+def _build_palette_image(job):
+    """Encodes one palette template image unless it already exists"""
+    filepath, width, height, color = job
+    if not os.path.exists(filepath):
+        create_sample_image(filepath, width=width, height=height, color=color)
+
+def _link_or_copy(src, dst):
+    """Hard-links src to dst, copying instead across devices; skips existing files"""
+    if os.path.exists(dst):
+        return
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+def _build_product(product, color_index):
+    """Creates one product folder with sample images and a description file"""
+    sku = product['sku']
+    product_dir = f'data/products/{sku}'
+    os.makedirs(product_dir, exist_ok=True)
+
+    # Link sample images from the palette (images only differ by color)
+    main_template, extra_template = _palette_paths(color_index)
+    _link_or_copy(main_template, f'{product_dir}/image1.jpg')
+    _link_or_copy(extra_template, f'{product_dir}/image2.jpg')
+
+    # Create description file
+    description = f"""Termék: {product['name']}
+SKU: {sku}
+Kategória: {product['category1']}
+Méret: {product['size']}
+Anyag: {product['material']}
+Színek: {product['color']}
+Vastagság: {product['thickness']}
+
+Ez egy gyönyörű {product['name'].lower()} puzzle, amely tökéletes dekoráció lehet otthonában.
+Kiváló minőségű {product['material']} anyagból készült, {product['thickness']} vastagságban.
+
+Jellemzők:
+- Precíz lézervágás
+- Környezetbarát anyag
+- Könnyű összeszerelés
+- Modern design
+
+A csomag {product['parts']} darab puzzle elemet tartalmaz.
+"""
+
+    with open(f'{product_dir}/description.txt', 'w', encoding='utf-8') as f:
+        f.write(description)
+
+    print(f"✅ Created product folder: {product_dir}")
+
 def create_folders_and_files():
     """Creates the complete folder structure with sample data"""
 
@@ -149,63 +248,44 @@ def create_folders_and_files():
     # Create product folders and files
     colors = [(255, 100, 100), (100, 255, 100), (100, 100, 255), (255, 255, 100), (255, 100, 255)]
 
-    for i, product in enumerate(products):
-        sku = product['sku']
-        product_dir = f'data/products/{sku}'
-        os.makedirs(product_dir, exist_ok=True)
-
-        # Create sample images
-        color = colors[i % len(colors)]
-        create_sample_image(f'{product_dir}/image1.jpg', color=color)
-        create_sample_image(f'{product_dir}/image2.jpg', width=600, height=800, color=color)
-
-        # Create description file
-        description = f"""Termék: {product['name']}
-SKU: {sku}
-Kategória: {product['category1']}
-Méret: {product['size']}
-Anyag: {product['material']}
-Színek: {product['color']}
-Vastagság: {product['thickness']}
-
-Ez egy gyönyörű {product['name'].lower()} puzzle, amely tökéletes dekoráció lehet otthonában.
-Kiváló minőségű {product['material']} anyagból készült, {product['thickness']} vastagságban.
-
-Jellemzők:
-- Precíz lézervágás
-- Környezetbarát anyag
-- Könnyű összeszerelés
-- Modern design
-
-A csomag {product['parts']} darab puzzle elemet tartalmaz.
-"""
+    # Encode each palette color once, in worker processes - JPEG encoding is CPU-bound
+    os.makedirs(PALETTE_DIR, exist_ok=True)
+    palette_jobs = []
+    for color_index, color in enumerate(colors):
+        main_template, extra_template = _palette_paths(color_index)
+        palette_jobs.append((main_template, 800, 600, color))
+        palette_jobs.append((extra_template, 600, 800, color))
 
-        with open(f'{product_dir}/description.txt', 'w', encoding='utf-8') as f:
-            f.write(description)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(executor.map(_build_palette_image, palette_jobs))
 
-        print(f"✅ Created product folder: {product_dir}")
+    for i, product in enumerate(products):
+        _build_product(product, i % len(colors))
 
     # Create Excel file
     print("\n📊 Creating Excel file...")
 
-    excel_data = []
-    for product in products:
-        excel_data.append({
-            'Kategória': product['category1'],
-            'Kategória 2': product['category2'],
-            'Kategória 3': product['category3'],
-            'Termék kód': product['sku'],
-            'Terméknév': product['name'],
-            'Méret (cm)': product['size'],
-            'Részek száma': product['parts'],
-            'Szín': product['color'],
-            'Anyag': product['material'],
-            'Vastagság': product['thickness'],
-            'Ár': product['price']
-        })
-
-    df = pd.DataFrame(excel_data)
-    df.to_excel('data/products.xlsx', index=False)
+    # Map Hungarian Excel columns to product fields, built column by column
+    excel_columns = {
+        'Kategória': 'category1',
+        'Kategória 2': 'category2',
+        'Kategória 3': 'category3',
+        'Termék kód': 'sku',
+        'Terméknév': 'name',
+        'Méret (cm)': 'size',
+        'Részek száma': 'parts',
+        'Szín': 'color',
+        'Anyag': 'material',
+        'Vastagság': 'thickness',
+        'Ár': 'price'
+    }
+    df = pd.DataFrame({column: [product[field] for product in products]
+                       for column, field in excel_columns.items()})
+
+    # constant_memory is not used with xlsxwriter: pandas writes cell by cell
+    # in column order, and that mode keeps only the latest row.
+    with pd.ExcelWriter('data/products.xlsx', engine=EXCEL_ENGINE) as writer:
+        df.to_excel(writer, index=False)
 
     print("✅ Created Excel file: data/products.xlsx")
 
@@ -236,6 +316,7 @@ if __name__ == "__main__":
             print("❌ Pillow not installed. Run: pip install Pillow")
         else:
             print(f"❌ Missing dependency: {e}")
-            print("Run: pip install pandas openpyxl Pillow")
+            print("Run: pip install pandas numpy openpyxl Pillow")
+            print("Optional (faster): pip install simplejpeg numba xlsxwriter")
     except Exception as e:
         print(f"❌ Error: {e}")
\ No newline at end of file
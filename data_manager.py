@@ -12,17 +12,166 @@ This module manages:
 Usage:
     from data_manager import DataManager
     dm = DataManager("products.db")
-    dm.sync_csv_to_db("data/products.csv")
+    dm.sync_xlsx_to_db("data/products.xlsx")
 """
 
 import sqlite3
 import pandas as pd
+import functools
+import importlib.util
 import json
 import os
-import glob
 import re
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from _fast_parse import NUMBA_AVAILABLE, parse_prices
+from database_setup import PRODUCT_IMAGES_TABLE_SQL
+
+# PyArrow is optional - multithreaded CSV parsing, much faster than the C engine.
+# pandas imports it itself, so only check that it is installed.
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+# python-calamine is optional - Rust Excel reader, much faster than openpyxl
+CALAMINE_AVAILABLE = importlib.util.find_spec('python_calamine') is not None
+
+# Hungarian spreadsheet columns and the database fields they map to
+CSV_COLUMN_MAP = {
+    'Termék kód': 'sku',
+    'Terméknév': 'product_name',
+    'Kategória': 'category1',
+    'Kategória 2': 'category2',
+    'Kategória 3': 'category3',
+    'Méret (cm)': 'size_cm',
+    'Részek száma': 'parts_count',
+    'Szín': 'color',
+    'Anyag': 'material',
+    'Vastagság': 'thickness',
+    'Ár': 'price'
+}
+
+# CSV files larger than this are streamed in chunks to keep memory bounded
+CSV_STREAM_MIN_BYTES = 256 * 1024 * 1024
+CSV_CHUNK_ROWS = 50_000
+
+# Category levels joined into category_path, after CSV_COLUMN_MAP renaming
+CATEGORY_COLUMNS = ('category1', 'category2', 'category3')
+
+# Insert or update one product from spreadsheet data; prepared once and
+# rebound for every row by executemany. Existing rows are updated in place,
+# keeping their id and status flags.
+_INSERT_PRODUCT_SQL = """
+INSERT INTO products 
+(sku, product_name, category_path, size_cm, parts_count, color, 
+ material, thickness, price, last_modified_timestamp)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(sku) DO UPDATE SET
+    product_name = excluded.product_name,
+    category_path = excluded.category_path,
+    size_cm = excluded.size_cm,
+    parts_count = excluded.parts_count,
+    color = excluded.color,
+    material = excluded.material,
+    thickness = excluded.thickness,
+    price = excluded.price,
+    last_modified_timestamp = excluded.last_modified_timestamp
+"""
+
+# Record which image/description files were found for a product
+_UPDATE_PRODUCT_FILES_SQL = """
+UPDATE products 
+SET has_image = ?, has_description = ?, main_image_filename = ?, 
+    extra_image_filenames = ?, description_filename = ?,
+    last_checked_timestamp = ?
+WHERE id = ?
+"""
+
+# Columns at least this long are worth the Numba price parser's setup cost
+FAST_PARSE_MIN_ROWS = 10_000
+
+# Image rows found by a filesystem scan; the scan replaces the whole table
+_INSERT_PRODUCT_IMAGE_SQL = """
+INSERT INTO product_images (product_id, position, filename, is_main)
+VALUES (?, ?, ?, ?)
+"""
+
+# Characters dropped from a price before parsing: spaces and thousands dots
+_PRICE_DELETE = str.maketrans('', '', ' .')
+
+# Product folders listed concurrently during a filesystem scan (scandir releases the GIL)
+SCAN_WORKERS = 16
+
+# Rows pulled from SQLite per fetchmany call when streaming products
+PRODUCT_FETCH_SIZE = 1000
+
+# Recognized product file extensions, in order of preference
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp')
+DESCRIPTION_EXTENSIONS = ('.txt', '.html', '.md')
+
+def _scan_product_folder(product_folder):
+    """
+    Lists a product folder once and picks out its image and description files.
+    
+    Files are ordered by extension preference, then by name.
+    
+    Args:
+        product_folder (str): Path to the product folder
+        
+    Returns:
+        tuple: (image filenames, description filenames); empty if the folder is missing
+    """
+    images = []
+    descriptions = []
+    
+    try:
+        with os.scandir(product_folder) as entries:
+            for entry in entries:
+                if entry.name.startswith('.') or not entry.is_file():
+                    continue
+                
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in IMAGE_EXTENSIONS:
+                    images.append((IMAGE_EXTENSIONS.index(ext), entry.name))
+                elif ext in DESCRIPTION_EXTENSIONS:
+                    descriptions.append((DESCRIPTION_EXTENSIONS.index(ext), entry.name))
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    
+    return [name for _, name in sorted(images)], [name for _, name in sorted(descriptions)]
+
+# Status fields update_product_status may change, in the order they are bound
+STATUS_FIELDS = ('is_active', 'is_uploaded', 'has_image', 'has_description')
+
+@functools.lru_cache(maxsize=None)
+def _status_update_sql(fields):
+    """
+    Builds the UPDATE statement for one combination of status fields.
+    
+    Cached, so repeated updates reuse the same SQL string and sqlite3's
+    prepared-statement cache.
+    
+    Args:
+        fields (tuple): Field names, in STATUS_FIELDS order
+        
+    Returns:
+        str: UPDATE statement binding the fields, then the timestamp and id
+    """
+    set_clauses = [f"{field} = ?" for field in fields]
+    set_clauses.append("last_modified_timestamp = ?")
+    return f"UPDATE products SET {', '.join(set_clauses)} WHERE id = ?"
+
+def _status_fields(kwargs):
+    """
+    Picks the recognized status fields out of keyword arguments.
+    
+    Args:
+        kwargs (dict): Requested field updates
+        
+    Returns:
+        tuple: (field names in STATUS_FIELDS order, their values)
+    """
+    fields = tuple(field for field in STATUS_FIELDS if field in kwargs)
+    return fields, [kwargs[field] for field in fields]
 
 class DataManager:
     """
@@ -48,13 +197,57 @@ class DataManager:
         Creates the database if it doesn't exist.
         """
         try:
-            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            # isolation_level=None: transactions are opened explicitly with BEGIN
+            self.connection = sqlite3.connect(self.db_path, check_same_thread=False,
+                                              isolation_level=None, cached_statements=256)
             self.connection.row_factory = sqlite3.Row  # Enable column access by name
+            
+            # WAL journal with NORMAL sync: one fsync per checkpoint instead of per commit,
+            # still crash-safe. Larger page cache and mmap cut read syscalls.
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute("PRAGMA wal_autocheckpoint=1000")
+            self.connection.execute("PRAGMA temp_store=MEMORY")
+            self.connection.execute("PRAGMA cache_size=-65536")  # 64 MiB
+            self.connection.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+            self.connection.execute("PRAGMA foreign_keys=ON")
+            
+            # Databases created before the image table existed get it on first use
+            self.connection.execute(PRODUCT_IMAGES_TABLE_SQL)
+            
             print(f"✅ Connected to database: {self.db_path}")
         except sqlite3.Error as e:
             print(f"❌ Database connection error: {e}")
             raise
     
+    def load_excel(self, xlsx_path):
+        """
+        Reads an Excel file into a cleaned DataFrame.
+        
+        Uses the calamine engine when python-calamine is installed, openpyxl otherwise.
+        
+        Args:
+            xlsx_path (str): Path to the input Excel file
+            
+        Returns:
+            DataFrame: Sheet data with stripped column names and no empty rows
+        """
+        df = None
+        if CALAMINE_AVAILABLE:
+            try:
+                df = pd.read_excel(xlsx_path, engine='calamine')
+            except ValueError:
+                # pandas < 2.2 has no calamine engine
+                df = None
+        if df is None:
+            df = pd.read_excel(xlsx_path, engine='openpyxl')
+        
+        # Clean column names (remove extra spaces)
+        df.columns = df.columns.str.strip()
+        
+        # Remove completely empty rows
+        return df.dropna(how='all')
+    
     def convert_xlsx_to_csv(self, xlsx_path, csv_path):
         """
         Converts Excel file to sanitized CSV format.
@@ -74,14 +267,7 @@ class DataManager:
             # Create output directory if it doesn't exist
             os.makedirs(os.path.dirname(csv_path), exist_ok=True)
             
-            # Read Excel file with proper encoding
-            df = pd.read_excel(xlsx_path, engine='openpyxl')
-            
-            # Clean column names (remove extra spaces)
-            df.columns = df.columns.str.strip()
-            
-            # Remove completely empty rows
-            df = df.dropna(how='all')
+            df = self.load_excel(xlsx_path)
             
             # Save as CSV with UTF-8 encoding
             df.to_csv(csv_path, index=False, encoding='utf-8')
@@ -95,72 +281,118 @@ class DataManager:
             print(f"❌ Excel conversion error: {e}")
             return False
     
-    def _build_category_path(self, row):
+    def _column(self, df, col):
         """
-        Builds category path from Kategória columns.
+        Returns a column from the DataFrame, or an all-NaN column if it is missing.
         
         Args:
-            row: Pandas row with category data
+            df: Pandas DataFrame
+            col (str): Column name
             
         Returns:
-            str: Category path like "Természet/Virágok"
+            Series: Column values aligned with df
         """
-        categories = []
-        
-        # Check each category column
-        for col in ['Kategória', 'Kategória 2', 'Kategória 3']:
-            if col in row and pd.notna(row[col]) and str(row[col]).strip():
-                categories.append(str(row[col]).strip())
-        
-        return '/'.join(categories) if categories else ''
+        if col in df.columns:
+            return df[col]
+        return pd.Series(float('nan'), index=df.index)
     
-    def _parse_price(self, price_str):
+    def _text_column(self, df, col):
         """
-        Parses price from format "13.990 ; 8990" to extract main price.
+        Returns a column as stripped nullable strings. Missing and blank
+        values (and a missing column) become <NA>.
         
         Args:
-            price_str: Price string from spreadsheet
+            df: Pandas DataFrame
+            col (str): Column name
             
         Returns:
-            float: Parsed price or 0.0 if parsing fails
+            Series: 'string' dtype values aligned with df
         """
-        if pd.isna(price_str) or not str(price_str).strip():
-            return 0.0
-            
-        try:
-            # Convert to string and clean
-            price_clean = str(price_str).strip()
-            
-            # Handle format "13.990 ; 8990" - take first price
-            if ';' in price_clean:
-                price_clean = price_clean.split(';')[0].strip()
-            
-            # Remove spaces and convert to float
-            price_clean = price_clean.replace(' ', '').replace('.', '')
+        if col in df.columns:
+            text = df[col].astype('string').str.strip()
+            return text.mask(text == '')
+        return pd.Series(pd.NA, index=df.index, dtype='string')
+    
+    def _build_category_path(self, df):
+        """
+        Builds category paths from the Kategória columns.
+        
+        Args:
+            df: Pandas DataFrame with category data (columns renamed via CSV_COLUMN_MAP)
             
-            return float(price_clean)
+        Returns:
+            Series: Category paths like "Természet/Virágok" ('' if no category)
+        """
+        path = pd.Series('', index=df.index)
+        
+        # The column set is the same for every row - check it once and skip absent levels
+        present = [col for col in CATEGORY_COLUMNS if col in df.columns]
+        
+        # Append each non-empty category level, column by column
+        for col in present:
+            part = df[col].astype('string').str.strip().fillna('')
+            appended = (path + '/' + part).where(part != '', path)
+            path = part.where(path == '', appended)
+        
+        return path
+    
+    def _parse_price(self, prices):
+        """
+        Parses prices from format "13.990 ; 8990" to extract main price.
+        
+        Large columns go through the compiled parser when Numba is installed;
+        anything it rejects falls back to the pandas path.
+        
+        Args:
+            prices: Series of price strings from spreadsheet
             
-        except (ValueError, AttributeError):
+        Returns:
+            Series: Parsed prices, 0.0 where parsing fails
+        """
+        raw = prices.fillna('').astype(str).str.strip()
+        
+        if NUMBA_AVAILABLE and len(raw) >= FAST_PARSE_MIN_ROWS:
+            values, valid = parse_prices(raw.tolist())
+            parsed = pd.Series(values, index=raw.index)
+            rejected = ~valid
+            if rejected.any():
+                parsed[rejected] = self._to_price(raw[rejected])
+        else:
+            parsed = self._to_price(raw)
+        
+        for price_str in raw[parsed.isna() & (raw != '')]:
             print(f"⚠️ Could not parse price: {price_str}")
-            return 0.0
+        
+        return parsed.fillna(0.0).astype(float)
     
-    def _parse_parts_count(self, parts_str):
+    def _to_price(self, raw):
         """
-        Parses parts count from "Részek száma" column.
+        Converts stripped price strings to numbers with pandas.
         
         Args:
-            parts_str: Parts count string
+            raw: Series of stripped price strings
             
         Returns:
-            int: Parts count or 0 if parsing fails
+            Series: Parsed prices, NaN where parsing fails
         """
-        if pd.isna(parts_str):
-            return 0
+        # Handle format "13.990 ; 8990" - take first price, drop spaces and thousands dots
+        cleaned = raw.str.split(';', n=1).str[0].str.translate(_PRICE_DELETE)
+        return pd.to_numeric(cleaned, errors='coerce')
+    
+    def _parse_parts_count(self, parts):
+        """
+        Parses parts counts from "Részek száma" column.
+        
+        Args:
+            parts: Series of parts count values
             
-        try:
-            return int(str(parts_str).strip())
-        except (ValueError, AttributeError):
-            return 0
+        Returns:
+            Series: Parts counts, 0 where parsing fails
+        """
+        counts = pd.to_numeric(parts, errors='coerce')
+        
+        # Only whole numbers are valid counts
+        return counts.where(counts % 1 == 0).fillna(0).astype('int64')
     
     def sync_csv_to_db(self, csv_path):
         """
@@ -181,74 +413,175 @@ class DataManager:
         
         try:
             print(f"📥 Reading CSV: {csv_path}")
-            df = pd.read_csv(csv_path, encoding='utf-8')
             
-            print(f"📊 Processing {len(df)} rows from CSV")
-            print(f"📋 Columns: {list(df.columns)}")
+            # Read the header once so only mapped columns are parsed
+            columns = list(pd.read_csv(csv_path, encoding='utf-8', nrows=0).columns)
+            print(f"📋 Columns: {columns}")
             
-            cursor = self.connection.cursor()
-            processed = 0
-            errors = 0
-            
-            for index, row in df.iterrows():
-                try:
-                    # Skip rows without product code
-                    if pd.isna(row.get('Termék kód', '')) or not str(row['Termék kód']).strip():
-                        continue
-                    
-                    # Map Hungarian columns to database fields
-                    product_data = {
-                        'sku': str(row['Termék kód']).strip(),
-                        'product_name': str(row.get('Terméknév', '')).strip(),
-                        'category_path': self._build_category_path(row),
-                        'size_cm': str(row.get('Méret (cm)', '')).strip(),
-                        'parts_count': self._parse_parts_count(row.get('Részek száma')),
-                        'color': str(row.get('Szín', '')).strip(),
-                        'material': str(row.get('Anyag', '')).strip(),
-                        'thickness': str(row.get('Vastagság', '')).strip(),
-                        'price': self._parse_price(row.get('Ár')),
-                        'last_modified_timestamp': datetime.now().isoformat()
-                    }
-                    
-                    # Insert or update product
-                    insert_sql = """
-                    INSERT OR REPLACE INTO products 
-                    (sku, product_name, category_path, size_cm, parts_count, color, 
-                     material, thickness, price, last_modified_timestamp)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """
-                    
-                    cursor.execute(insert_sql, (
-                        product_data['sku'],
-                        product_data['product_name'],
-                        product_data['category_path'],
-                        product_data['size_cm'],
-                        product_data['parts_count'],
-                        product_data['color'],
-                        product_data['material'],
-                        product_data['thickness'],
-                        product_data['price'],
-                        product_data['last_modified_timestamp']
-                    ))
-                    
-                    processed += 1
-                    
-                except Exception as e:
-                    errors += 1
-                    print(f"⚠️ Error processing row {index}: {e}")
-                    continue
+            if 'Termék kód' not in columns:
+                print("❌ CSV has no 'Termék kód' column")
+                return 0
             
-            self.connection.commit()
+            usecols = [col for col in columns if col in CSV_COLUMN_MAP]
+            return self._sync_frames(self._read_csv_chunks(csv_path, usecols))
+            
+        except Exception as e:
+            print(f"❌ CSV sync error: {e}")
+            return 0
+    
+    def sync_df_to_db(self, df):
+        """
+        Syncs spreadsheet data already loaded in a DataFrame to the database.
+        
+        Args:
+            df: Pandas DataFrame with the Hungarian spreadsheet columns
+            
+        Returns:
+            int: Number of products processed
+        """
+        try:
+            print(f"📋 Columns: {list(df.columns)}")
             
-            print(f"✅ Processed {processed} products successfully")
-            if errors > 0:
-                print(f"⚠️ {errors} rows had errors")
+            if 'Termék kód' not in df.columns:
+                print("❌ Data has no 'Termék kód' column")
+                return 0
             
-            return processed
+            return self._sync_frames([df])
             
         except Exception as e:
-            print(f"❌ CSV sync error: {e}")
+            print(f"❌ Data sync error: {e}")
+            return 0
+    
+    def sync_xlsx_to_db(self, xlsx_path):
+        """
+        Syncs an Excel file straight to the database, without a CSV roundtrip.
+        
+        Args:
+            xlsx_path (str): Path to the Excel file
+            
+        Returns:
+            int: Number of products processed
+        """
+        if not os.path.exists(xlsx_path):
+            print(f"❌ Excel file not found: {xlsx_path}")
             return 0
+        
+        try:
+            print(f"📥 Reading Excel: {xlsx_path}")
+            df = self.load_excel(xlsx_path)
+        except Exception as e:
+            print(f"❌ Excel read error: {e}")
+            return 0
+        
+        return self.sync_df_to_db(df)
+    
+    def _sync_frames(self, frames):
+        """
+        Inserts or updates products from one or more DataFrames.
+        
+        All frames are written in a single transaction.
+        
+        Args:
+            frames: Iterable of DataFrames with the Hungarian spreadsheet columns
+            
+        Returns:
+            int: Number of products processed
+        """
+        # One Unix timestamp for the whole batch
+        timestamp = int(time.time())
+        processed = 0
+        
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            for frame in frames:
+                print(f"📊 Processing {len(frame)} rows")
+                rows = self._build_product_rows(frame, timestamp)
+                cursor.executemany(_INSERT_PRODUCT_SQL, rows)
+                processed += len(rows)
+            self.connection.commit()
+        except BaseException:
+            # Frames are parsed lazily inside the transaction, so parse
+            # errors must release the write lock too
+            self.connection.rollback()
+            raise
+        
+        if processed == 0:
+            print("⚠️ No rows with a product code found")
+            return 0
+        
+        # Refresh planner statistics so the composite indexes get picked
+        cursor.execute("ANALYZE products")
+        
+        print(f"✅ Processed {processed} products successfully")
+        
+        return processed
+    
+    def _read_csv_chunks(self, csv_path, usecols):
+        """
+        Reads the CSV as string columns, yielding one or more DataFrames.
+        
+        Small files are parsed in one go (with PyArrow when available); files
+        over CSV_STREAM_MIN_BYTES are streamed in CSV_CHUNK_ROWS chunks, which
+        the PyArrow engine does not support.
+        
+        Args:
+            csv_path (str): Path to the CSV file
+            usecols (list): Columns to parse
+            
+        Yields:
+            DataFrame: Rows from the CSV with the requested columns
+        """
+        # Every field is parsed from text anyway - skip dtype inference
+        options = {'encoding': 'utf-8', 'usecols': usecols, 'dtype': str}
+        
+        if os.path.getsize(csv_path) >= CSV_STREAM_MIN_BYTES:
+            with pd.read_csv(csv_path, chunksize=CSV_CHUNK_ROWS, **options) as reader:
+                yield from reader
+        elif PYARROW_AVAILABLE:
+            yield pd.read_csv(csv_path, engine='pyarrow', **options)
+        else:
+            yield pd.read_csv(csv_path, **options)
+    
+    def _build_product_rows(self, df, timestamp):
+        """
+        Maps spreadsheet rows to parameter tuples for _INSERT_PRODUCT_SQL.
+        
+        Rows without a product code are skipped.
+        
+        Args:
+            df: Pandas DataFrame with the Hungarian spreadsheet columns
+            timestamp (int): Unix modification time stored on every row
+            
+        Returns:
+            list: One tuple per product
+        """
+        # Map Hungarian columns to database field names once
+        df = df.rename(columns=CSV_COLUMN_MAP)
+        
+        # Skip rows without product code
+        skus = self._text_column(df, 'sku')
+        has_sku = skus.notna()
+        df = df[has_sku]
+        skus = skus[has_sku]
+        
+        # Parse each database field as a whole column
+        records = pd.DataFrame({
+            'sku': skus,
+            'product_name': self._text_column(df, 'product_name').fillna(''),  # NOT NULL
+            'category_path': self._build_category_path(df),
+            'size_cm': self._text_column(df, 'size_cm'),
+            'parts_count': self._parse_parts_count(self._column(df, 'parts_count')),
+            'color': self._text_column(df, 'color'),
+            'material': self._text_column(df, 'material'),
+            'thickness': self._text_column(df, 'thickness'),
+            'price': self._parse_price(self._column(df, 'price')),
+            'last_modified_timestamp': timestamp
+        })
+        
+        # Missing optional fields are stored as NULL
+        records = records.astype(object).where(records.notna(), None)
+        return list(records.itertuples(index=False, name=None))
     
     def scan_and_sync_filesystem(self, root_folder_path):
         """
@@ -276,12 +609,17 @@ class DataManager:
         cursor.execute("SELECT id, sku FROM products")
         products = cursor.fetchall()
         
-        for product in products:
+        timestamp = int(time.time())
+        updates = []
+        image_rows = []
+        
+        # List the product folders (by SKU) in parallel; results come back in product order
+        product_folders = [os.path.join(root_folder_path, product['sku']) for product in products]
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+            folder_files = list(executor.map(_scan_product_folder, product_folders))
+        
+        for product, (image_files, desc_files) in zip(products, folder_files):
             product_id = product['id']
-            sku = product['sku']
-            
-            # Look for product folder (by SKU)
-            product_folder = os.path.join(root_folder_path, sku)
             
             has_image = False
             has_description = False
@@ -289,55 +627,42 @@ class DataManager:
             extra_images = []
             description_file = None
             
-            if os.path.exists(product_folder):
-                # Scan for image files
-                image_extensions = ['*.jpg', '*.jpeg', '*.png', '*.gif', '*.bmp']
-                image_files = []
-                
-                for ext in image_extensions:
-                    image_files.extend(glob.glob(os.path.join(product_folder, ext)))
-                
-                if image_files:
-                    has_image = True
-                    main_image = os.path.basename(image_files[0])  # First image as main
-                    if len(image_files) > 1:
-                        extra_images = [os.path.basename(f) for f in image_files[1:]]
-                    stats['images'] += len(image_files)
-                
-                # Scan for description files
-                desc_extensions = ['*.txt', '*.html', '*.md']
-                desc_files = []
-                
-                for ext in desc_extensions:
-                    desc_files.extend(glob.glob(os.path.join(product_folder, ext)))
-                
-                if desc_files:
-                    has_description = True
-                    description_file = os.path.basename(desc_files[0])  # First description file
-                    stats['descriptions'] += len(desc_files)
-            
-            # Update database
-            update_sql = """
-            UPDATE products 
-            SET has_image = ?, has_description = ?, main_image_filename = ?, 
-                extra_image_filenames = ?, description_filename = ?,
-                last_checked_timestamp = ?
-            WHERE id = ?
-            """
-            
-            cursor.execute(update_sql, (
+            if image_files:
+                has_image = True
+                image_rows.extend((product_id, position, filename, position == 0)
+                                  for position, filename in enumerate(image_files))
+                main_image = image_files[0]  # First image as main
+                if len(image_files) > 1:
+                    extra_images = image_files[1:]
+                stats['images'] += len(image_files)
+            
+            if desc_files:
+                has_description = True
+                description_file = desc_files[0]  # First description file
+                stats['descriptions'] += len(desc_files)
+            
+            updates.append((
                 has_image,
                 has_description,
                 main_image,
                 json.dumps(extra_images) if extra_images else None,
                 description_file,
-                datetime.now().isoformat(),
+                timestamp,
                 product_id
             ))
-            
-            stats['updated'] += 1
         
-        self.connection.commit()
+        # Write all updates in one transaction
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.executemany(_UPDATE_PRODUCT_FILES_SQL, updates)
+            cursor.execute("DELETE FROM product_images")
+            cursor.executemany(_INSERT_PRODUCT_IMAGE_SQL, image_rows)
+            self.connection.commit()
+        except sqlite3.Error:
+            self.connection.rollback()
+            raise
+        
+        stats['updated'] = len(updates)
         
         print(f"✅ Filesystem scan complete:")
         print(f"  📁 Updated {stats['updated']} products")
@@ -369,6 +694,65 @@ class DataManager:
             print(f"❌ Error retrieving product {product_id}: {e}")
             return None
     
+    def get_product_images(self, product_id):
+        """
+        Retrieves a product's image filenames, main image first.
+        
+        Args:
+            product_id (int): Product ID
+            
+        Returns:
+            list: Image filenames in display order
+        """
+        try:
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT filename FROM product_images
+                WHERE product_id = ?
+                ORDER BY position
+            """, (product_id,))
+            return [row['filename'] for row in cursor.fetchall()]
+            
+        except sqlite3.Error as e:
+            print(f"❌ Error retrieving images for product {product_id}: {e}")
+            return []
+    
+    def iter_products(self, filter_incomplete=False):
+        """
+        Yields active products one at a time, without loading the whole list.
+        
+        Rows are fetched from SQLite in batches of PRODUCT_FETCH_SIZE. Database
+        errors are raised to the caller.
+        
+        Args:
+            filter_incomplete (bool): If True, only yield products with images and descriptions
+            
+        Yields:
+            dict: Product data
+        """
+        cursor = self.connection.cursor()
+        cursor.arraysize = PRODUCT_FETCH_SIZE
+        
+        if filter_incomplete:
+            cursor.execute("""
+                SELECT * FROM products 
+                WHERE is_active = 1 AND has_image = 1 AND has_description = 1
+                ORDER BY category_path, product_name
+            """)
+        else:
+            cursor.execute("""
+                SELECT * FROM products 
+                WHERE is_active = 1
+                ORDER BY category_path, product_name
+            """)
+        
+        while True:
+            rows = cursor.fetchmany()
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
+    
     def get_all_products(self, filter_incomplete=False):
         """
         Retrieves all products from the database.
@@ -380,23 +764,7 @@ class DataManager:
             list: List of product dictionaries
         """
         try:
-            cursor = self.connection.cursor()
-            
-            if filter_incomplete:
-                cursor.execute("""
-                    SELECT * FROM products 
-                    WHERE is_active = 1 AND has_image = 1 AND has_description = 1
-                    ORDER BY category_path, product_name
-                """)
-            else:
-                cursor.execute("""
-                    SELECT * FROM products 
-                    WHERE is_active = 1
-                    ORDER BY category_path, product_name
-                """)
-            
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            return list(self.iter_products(filter_incomplete))
             
         except sqlite3.Error as e:
             print(f"❌ Error retrieving products: {e}")
@@ -414,28 +782,17 @@ class DataManager:
             bool: True if update successful
         """
         try:
-            # Build dynamic update query
-            set_clauses = []
-            values = []
-            
-            for field, value in kwargs.items():
-                if field in ['is_active', 'is_uploaded', 'has_image', 'has_description']:
-                    set_clauses.append(f"{field} = ?")
-                    values.append(value)
+            fields, values = _status_fields(kwargs)
             
-            if not set_clauses:
+            if not fields:
                 return False
             
-            # Add timestamp
-            set_clauses.append("last_modified_timestamp = ?")
-            values.append(datetime.now().isoformat())
+            # Add timestamp (Unix time)
+            values.append(int(time.time()))
             values.append(product_id)
             
-            update_sql = f"UPDATE products SET {', '.join(set_clauses)} WHERE id = ?"
-            
             cursor = self.connection.cursor()
-            cursor.execute(update_sql, values)
-            self.connection.commit()
+            cursor.execute(_status_update_sql(fields), values)
             
             return cursor.rowcount > 0
             
@@ -443,6 +800,45 @@ class DataManager:
             print(f"❌ Error updating product {product_id}: {e}")
             return False
     
+    def update_product_statuses(self, updates):
+        """
+        Updates status fields for many products in a single transaction.
+        
+        Args:
+            updates: Iterable of (product_id, fields) pairs, where fields is a dict
+                     like {'is_uploaded': 1}
+            
+        Returns:
+            int: Number of products updated
+        """
+        timestamp = int(time.time())
+        
+        # Group rows by field combination so each group is one executemany
+        batches = {}
+        for product_id, kwargs in updates:
+            fields, values = _status_fields(kwargs)
+            if fields:
+                batches.setdefault(fields, []).append((*values, timestamp, product_id))
+        
+        if not batches:
+            return 0
+        
+        cursor = self.connection.cursor()
+        updated = 0
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            for fields, rows in batches.items():
+                cursor.executemany(_status_update_sql(fields), rows)
+                updated += cursor.rowcount
+            self.connection.commit()
+            
+        except sqlite3.Error as e:
+            self.connection.rollback()
+            print(f"❌ Error updating product statuses: {e}")
+            return 0
+        
+        return updated
+    
     def get_database_stats(self):
         """
         Returns database statistics.
@@ -453,31 +849,26 @@ class DataManager:
         try:
             cursor = self.connection.cursor()
             
-            stats = {}
-            
-            # Total products
-            cursor.execute("SELECT COUNT(*) FROM products")
-            stats['total_products'] = cursor.fetchone()[0]
-            
-            # Active products
-            cursor.execute("SELECT COUNT(*) FROM products WHERE is_active = 1")
-            stats['active_products'] = cursor.fetchone()[0]
-            
-            # Products with images
-            cursor.execute("SELECT COUNT(*) FROM products WHERE has_image = 1")
-            stats['products_with_images'] = cursor.fetchone()[0]
-            
-            # Products with descriptions
-            cursor.execute("SELECT COUNT(*) FROM products WHERE has_description = 1")
-            stats['products_with_descriptions'] = cursor.fetchone()[0]
-            
-            # Uploaded products
-            cursor.execute("SELECT COUNT(*) FROM products WHERE is_uploaded = 1")
-            stats['uploaded_products'] = cursor.fetchone()[0]
+            # Gather every count in a single pass over the table
+            cursor.execute("""
+                SELECT COUNT(*),
+                       COALESCE(SUM(is_active = 1), 0),
+                       COALESCE(SUM(has_image = 1), 0),
+                       COALESCE(SUM(has_description = 1), 0),
+                       COALESCE(SUM(is_uploaded = 1), 0),
+                       COUNT(DISTINCT category_path)
+                FROM products
+            """)
+            row = cursor.fetchone()
             
-            # Categories
-            cursor.execute("SELECT COUNT(DISTINCT category_path) FROM products WHERE category_path IS NOT NULL")
-            stats['categories'] = cursor.fetchone()[0]
+            stats = {
+                'total_products': row[0],
+                'active_products': row[1],
+                'products_with_images': row[2],
+                'products_with_descriptions': row[3],
+                'uploaded_products': row[4],
+                'categories': row[5]  # COUNT(DISTINCT) skips NULL paths
+            }
             
             return stats
             
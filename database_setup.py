@@ -13,12 +13,27 @@ import sqlite3
 import os
 from datetime import datetime
 
+# One row per product image; position 0 is the main image. Products keep the
+# extra_image_filenames JSON column as well, for readers that load a whole row.
+PRODUCT_IMAGES_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS product_images (
+    product_id INTEGER NOT NULL REFERENCES products(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    filename TEXT NOT NULL,
+    is_main INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (product_id, position)
+) WITHOUT ROWID
+"""
+
 def create_database():
     """
     Creates the SQLite database and products table with all required columns.
     
     The schema matches the Hungarian spreadsheet structure with additional
     tracking fields for file management and upload status.
+    
+    Returns:
+        bool: True if the database was created and verified
     """
     
     # Database file path
@@ -29,10 +44,16 @@ def create_database():
         print(f"Removing existing database: {db_path}")
         os.remove(db_path)
     
-    # Create new database connection
-    conn = sqlite3.connect(db_path)
+    # Create new database connection; transactions are opened explicitly with BEGIN
+    conn = sqlite3.connect(db_path, isolation_level=None)
     cursor = conn.cursor()
     
+    # Page layout can only be chosen before the first table exists: larger pages
+    # fit more of the wide product rows each, and incremental auto-vacuum lets
+    # freed pages be returned without a full VACUUM
+    cursor.execute("PRAGMA page_size=8192")
+    cursor.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    
     # Create products table with complete schema
     create_table_sql = """
     CREATE TABLE products (
@@ -49,28 +70,36 @@ def create_database():
         main_image_filename TEXT,
         extra_image_filenames TEXT,  -- JSON list of additional images
         description_filename TEXT,
-        has_image BOOLEAN DEFAULT 0,
-        has_description BOOLEAN DEFAULT 0,
-        is_uploaded BOOLEAN DEFAULT 0,
-        is_active BOOLEAN DEFAULT 1,
-        last_checked_timestamp TEXT,
-        last_modified_timestamp TEXT,
+        has_image INTEGER DEFAULT 0,
+        has_description INTEGER DEFAULT 0,
+        is_uploaded INTEGER DEFAULT 0,
+        is_active INTEGER DEFAULT 1,
+        last_checked_timestamp INTEGER,  -- Unix time
+        last_modified_timestamp INTEGER,  -- Unix time
         created_timestamp TEXT DEFAULT CURRENT_TIMESTAMP
     )
     """
     
     try:
+        # Create the tables and indexes in one transaction - one commit instead of one per statement
+        cursor.execute("BEGIN")
         cursor.execute(create_table_sql)
+        cursor.execute(PRODUCT_IMAGES_TABLE_SQL)
         
         # Create indexes for better performance
         cursor.execute("CREATE INDEX idx_sku ON products(sku)")
         cursor.execute("CREATE INDEX idx_category ON products(category_path)")
-        cursor.execute("CREATE INDEX idx_active ON products(is_active)")
-        cursor.execute("CREATE INDEX idx_uploaded ON products(is_uploaded)")
         
-        conn.commit()
+        # Match get_all_products' filters and ORDER BY so product lists are read
+        # in index order without a separate sort (is_active alone is covered by
+        # the prefix; low-selectivity flag-only indexes just slow down writes)
+        cursor.execute("CREATE INDEX idx_active_cat_name ON products(is_active, category_path, product_name)")
+        cursor.execute("CREATE INDEX idx_complete ON products(is_active, has_image, has_description, category_path, product_name)")
+        
+        cursor.execute("COMMIT")
         print(f"✅ Database created successfully: {db_path}")
         print("✅ Products table created with all required columns")
+        print("✅ Product images table created")
         print("✅ Indexes created for better performance")
         
         # Display table schema for verification
@@ -82,13 +111,51 @@ def create_database():
             nullable = "" if col[3] else "NULL"
             default = f"DEFAULT {col[4]}" if col[4] else ""
             print(f"  {col[1]} ({col[2]}) {nullable} {default}".strip())
+        
+        # Verify on the same connection instead of reopening the file
+        print("\n🔍 Verifying database setup...")
+        return _verify_schema(cursor)
             
     except sqlite3.Error as e:
+        if conn.in_transaction:
+            conn.rollback()
         print(f"❌ Database error: {e}")
+        return False
         
     finally:
         conn.close()
 
+def _verify_schema(cursor):
+    """
+    Checks that the products table exists with all expected columns.
+    
+    Args:
+        cursor: Cursor on an open database connection
+        
+    Returns:
+        bool: True if the schema is complete
+    """
+    # Check if products table exists
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='products'")
+    table_exists = cursor.fetchone()
+    
+    if table_exists:
+        # Count expected columns
+        cursor.execute("PRAGMA table_info(products)")
+        columns = cursor.fetchall()
+        expected_columns = 19  # Total columns we expect
+        
+        if len(columns) >= expected_columns:
+            print("✅ Database verification successful")
+            print(f"✅ Found {len(columns)} columns in products table")
+            return True
+        else:
+            print(f"❌ Expected {expected_columns} columns, found {len(columns)}")
+            return False
+    else:
+        print("❌ Products table not found")
+        return False
+
 def verify_database():
     """
     Verifies that the database was created correctly.
@@ -102,28 +169,7 @@ def verify_database():
         
     try:
         conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-        
-        # Check if products table exists
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='products'")
-        table_exists = cursor.fetchone()
-        
-        if table_exists:
-            # Count expected columns
-            cursor.execute("PRAGMA table_info(products)")
-            columns = cursor.fetchall()
-            expected_columns = 19  # Total columns we expect
-            
-            if len(columns) >= expected_columns:
-                print("✅ Database verification successful")
-                print(f"✅ Found {len(columns)} columns in products table")
-                return True
-            else:
-                print(f"❌ Expected {expected_columns} columns, found {len(columns)}")
-                return False
-        else:
-            print("❌ Products table not found")
-            return False
+        return _verify_schema(conn.cursor())
             
     except sqlite3.Error as e:
         print(f"❌ Database verification error: {e}")
@@ -135,9 +181,7 @@ def verify_database():
 if __name__ == "__main__":
     print("🚀 Setting up ShopBot database...")
     print("=" * 50)
-    create_database()
-    print("\n🔍 Verifying database setup...")
-    if verify_database():
+    if create_database():
         print("\n🎉 Database setup complete!")
         print("\nNext steps:")
         print("1. Run: python data_manager.py (to test data operations)")
@@ -12,22 +12,166 @@ Usage:
 Author: ShopBot Development Team
 """
 
+import atexit
+import functools
 import sys
 import json
 import os
 from datetime import datetime
 
+# Status report, filled by format_map; the development phases are static
+SYSTEM_STATUS = """
+============================================================
+📊 SYSTEM STATUS
+============================================================
+{deps_icon} Dependencies: {deps}
+{config_icon} Configuration: {config}
+{db_icon} Database: {db}
+{dm_icon} Data Manager: {dm}
+{bot_icon} Bot Driver: {bot}
+
+============================================================
+🏗️ DEVELOPMENT PHASES
+============================================================
+✅ Phase 1 (Backend Foundation) - COMPLETE
+  ✅ Database schema created
+  ✅ Data manager implemented
+  ✅ Bot driver implemented
+  ✅ All modules tested
+
+⏳ Phase 2 (GUI) - READY FOR DEVELOPMENT
+  ⏳ PyQt main window
+  ⏳ Control panel tab
+  ⏳ Database manager tab
+
+⏳ Phase 3 (Integration) - WAITING
+  ⏳ Drag & drop functionality
+  ⏳ Full automation workflow
+  ⏳ Threading integration
+"""
+
+# Printed in one write when setup is incomplete
+QUICK_START_GUIDE = """
+============================================================
+🚀 SHOPBOT QUICK START GUIDE
+============================================================
+
+1️⃣ SETUP DATABASE:
+   python database_setup.py
+
+2️⃣ PREPARE YOUR DATA:
+   - Place your Excel file in: data/products.xlsx
+   - Create product folders in: data/products/[SKU]/
+   - Add images and descriptions to product folders
+
+3️⃣ IMPORT DATA:
+   python -c "from data_manager import DataManager; dm = DataManager(); dm.sync_xlsx_to_db('data/products.xlsx'); dm.close()"
+
+4️⃣ SCAN FILES:
+   python -c "from data_manager import DataManager; dm = DataManager(); dm.scan_and_sync_filesystem('data/products'); dm.close()"
+
+5️⃣ INSTALL BROWSER AUTOMATION:
+   pip install playwright
+   playwright install chromium
+
+6️⃣ RUN APPLICATION:
+   python main.py
+
+============================================================
+📁 EXPECTED FOLDER STRUCTURE:
+============================================================
+shopbot/
+├── main.py
+├── database_setup.py
+├── data_manager.py
+├── bot_driver.py
+├── config.json
+├── products.db
+└── data/
+    ├── products.xlsx
+    ├── products.csv
+    └── products/
+        ├── SKU001/
+        │   ├── image1.jpg
+        │   ├── image2.jpg
+        │   └── description.txt
+        └── SKU002/
+            └── ...
+"""
+
+# Emoji only go to a UTF-8 terminal; pipes, log files and legacy consoles get
+# the ASCII banners (and skip the console's slow Unicode path)
+USE_EMOJI = sys.stdout.isatty() and 'utf' in (sys.stdout.encoding or '').lower()
+
+# ASCII stand-ins for the banners' emoji and box-drawing characters
+ASCII_FALLBACKS = str.maketrans({
+    '✅': '[OK]',
+    '❌': '[FAIL]',
+    '⏳': '[..]',
+    '📊': '#',
+    '🏗': '#',
+    '📁': '#',
+    '🚀': '#',
+    '\u20e3': ')',   # keycap: "1️⃣" -> "1)"
+    '\ufe0f': None,  # emoji presentation selector
+    '├': '|',
+    '└': '`',
+    '│': '|',
+    '─': '-',
+})
+
+# SYSTEM_STATUS icons for passed and failed checks
+STATUS_ICONS = {True: '✅', False: '❌'}
+
+if not USE_EMOJI:
+    SYSTEM_STATUS = SYSTEM_STATUS.translate(ASCII_FALLBACKS)
+    QUICK_START_GUIDE = QUICK_START_GUIDE.translate(ASCII_FALLBACKS)
+    STATUS_ICONS = {ok: icon.translate(ASCII_FALLBACKS) for ok, icon in STATUS_ICONS.items()}
+
+# Shared DataManager; data_manager (and pandas) is only imported once a check needs it
+_dm = None
+
+def _get_dm():
+    """
+    Returns the shared DataManager, opening it on first use.
+    
+    Returns:
+        DataManager: Connection reused by every check in this run
+    """
+    global _dm
+    if _dm is None:
+        from data_manager import DataManager
+        _dm = DataManager()
+        atexit.register(_dm.close)
+    return _dm
+
+@functools.lru_cache(maxsize=1)
+def _read_config(path, mtime_ns):
+    """
+    Reads and parses a config file; cached per modification time.
+    
+    Args:
+        path (str): Config file path
+        mtime_ns (int): File modification time, part of the cache key
+        
+    Returns:
+        dict: Parsed configuration (shared between calls - don't modify)
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 def load_config():
     """
     Loads configuration from config.json file.
     
+    The file is only re-read when it has changed since the last call.
+    
     Returns:
         dict: Configuration dictionary
     """
     
     try:
-        with open('config.json', 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = _read_config('config.json', os.stat('config.json').st_mtime_ns)
         print("✅ Configuration loaded successfully")
         return config
     except FileNotFoundError:
@@ -52,10 +196,11 @@ def check_dependencies():
         'bot_driver.py'
     ]
     
-    missing_files = []
-    for file in required_files:
-        if not os.path.exists(file):
-            missing_files.append(file)
+    # List the working directory once instead of checking each file separately
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries}
+    
+    missing_files = [file for file in required_files if file not in present]
     
     if missing_files:
         print(f"❌ Missing required files: {', '.join(missing_files)}")
@@ -69,41 +214,39 @@ def check_database():
     Checks if database exists and is properly set up.
     
     Returns:
-        bool: True if database is ready
+        dict: Database statistics (reused by the later checks), or None if
+              the database is not ready
     """
     if not os.path.exists('products.db'):
         print("⚠️ Database not found. Run 'python database_setup.py' first")
-        return False
+        return None
     
     # Try to connect and verify structure
     try:
-        from data_manager import DataManager
-        dm = DataManager()
-        stats = dm.get_database_stats()
-        dm.close()
+        stats = _get_dm().get_database_stats()
         
         print(f"✅ Database ready with {stats.get('total_products', 0)} products")
-        return True
+        return stats
         
     except Exception as e:
         print(f"❌ Database error: {e}")
-        return False
+        return None
 
-def test_data_manager():
+def test_data_manager(stats):
     """
     Tests the data manager functionality.
+    
+    Args:
+        stats (dict): Database statistics from check_database
     """
     print("\n🧪 Testing Data Manager...")
     
     try:
-        from data_manager import DataManager
-        dm = DataManager()
+        dm = _get_dm()
         
-        # Get database statistics
-        stats = dm.get_database_stats()
-        print("📊 Database Statistics:")
-        for key, value in stats.items():
-            print(f"  {key.replace('_', ' ').title()}: {value}")
+        # Database statistics were already read by check_database
+        print("\n".join(["📊 Database Statistics:",
+                         *(f"  {key.replace('_', ' ').title()}: {value}" for key, value in stats.items())]))
         
         # Test getting products
         products = dm.get_all_products()
@@ -111,32 +254,38 @@ def test_data_manager():
         
         if products:
             sample = products[0]
-            print(f"\n📋 Sample product (ID: {sample['id']}):")
-            print(f"  SKU: {sample['sku']}")
-            print(f"  Name: {sample['product_name']}")
-            print(f"  Category: {sample['category_path']}")
-            print(f"  Price: {sample['price']}")
-            print(f"  Has Image: {sample['has_image']}")
-            print(f"  Has Description: {sample['has_description']}")
+            print("\n".join([
+                f"\n📋 Sample product (ID: {sample['id']}):",
+                f"  SKU: {sample['sku']}",
+                f"  Name: {sample['product_name']}",
+                f"  Category: {sample['category_path']}",
+                f"  Price: {sample['price']}",
+                f"  Has Image: {sample['has_image']}",
+                f"  Has Description: {sample['has_description']}",
+            ]))
         
-        dm.close()
         return True
         
     except Exception as e:
         print(f"❌ Data Manager test failed: {e}")
         return False
 
-def test_bot_driver():
+def test_bot_driver(config):
     """
     Tests the bot driver functionality.
+    
+    Args:
+        config (dict): Loaded configuration
     """
     print("\n🤖 Testing Bot Driver...")
     
     try:
-        from bot_driver import BotDriverSync
+        from bot_driver import BotDriverSync, setup_logging
+        setup_logging()
         
         # Just test initialization (don't connect to avoid browser launch)
-        bot = BotDriverSync(headless=True)
+        bot = BotDriverSync(headless=True,
+                            concurrent_uploads=config.get('sync', {}).get('concurrent_uploads', 2))
         
         # Check if Playwright is available
         try:
@@ -158,51 +307,7 @@ def show_quick_start_guide():
     """
     Shows a quick start guide for setting up the application.
     """
-    print("\n" + "="*60)
-    print("🚀 SHOPBOT QUICK START GUIDE")
-    print("="*60)
-    
-    print("\n1️⃣ SETUP DATABASE:")
-    print("   python database_setup.py")
-    
-    print("\n2️⃣ PREPARE YOUR DATA:")
-    print("   - Place your Excel file in: data/products.xlsx")
-    print("   - Create product folders in: data/products/[SKU]/")
-    print("   - Add images and descriptions to product folders")
-    
-    print("\n3️⃣ IMPORT DATA:")
-    print("   python -c \"from data_manager import DataManager; dm = DataManager(); dm.convert_xlsx_to_csv('data/products.xlsx', 'data/products.csv'); dm.sync_csv_to_db('data/products.csv'); dm.close()\"")
-    
-    print("\n4️⃣ SCAN FILES:")
-    print("   python -c \"from data_manager import DataManager; dm = DataManager(); dm.scan_and_sync_filesystem('data/products'); dm.close()\"")
-    
-    print("\n5️⃣ INSTALL BROWSER AUTOMATION:")
-    print("   pip install playwright")
-    print("   playwright install chromium")
-    
-    print("\n6️⃣ RUN APPLICATION:")
-    print("   python main.py")
-    
-    print("\n" + "="*60)
-    print("📁 EXPECTED FOLDER STRUCTURE:")
-    print("="*60)
-    print("shopbot/")
-    print("├── main.py")
-    print("├── database_setup.py")
-    print("├── data_manager.py")
-    print("├── bot_driver.py")
-    print("├── config.json")
-    print("├── products.db")
-    print("└── data/")
-    print("    ├── products.xlsx")
-    print("    ├── products.csv")
-    print("    └── products/")
-    print("        ├── SKU001/")
-    print("        │   ├── image1.jpg")
-    print("        │   ├── image2.jpg")
-    print("        │   └── description.txt")
-    print("        └── SKU002/")
-    print("            └── ...")
+    sys.stdout.write(QUICK_START_GUIDE)
 
 def main():
     """
@@ -239,7 +344,8 @@ def main():
     
     # Check database
     print("\n🗄️ Checking database...")
-    db_ok = check_database()
+    stats = check_database()
+    db_ok = stats is not None
     
     if not db_ok:
         print("\n⚠️ Database needs setup. Run 'python database_setup.py' first.")
@@ -250,40 +356,18 @@ def main():
     print("\n🧪 Running component tests...")
     
     # Test Data Manager
-    dm_ok = test_data_manager()
+    dm_ok = test_data_manager(stats)
     
     # Test Bot Driver
-    bot_ok = test_bot_driver()
-    
-    # Show system status
-    print("\n" + "="*60)
-    print("📊 SYSTEM STATUS")
-    print("="*60)
-    print(f"✅ Dependencies: {'OK' if deps_ok else 'FAILED'}")
-    print(f"✅ Configuration: {'OK' if config else 'FAILED'}")
-    print(f"✅ Database: {'OK' if db_ok else 'FAILED'}")
-    print(f"✅ Data Manager: {'OK' if dm_ok else 'FAILED'}")
-    print(f"✅ Bot Driver: {'OK' if bot_ok else 'FAILED'}")
-    
-    # Phase status
-    print("\n" + "="*60)
-    print("🏗️ DEVELOPMENT PHASES")
-    print("="*60)
-    print("✅ Phase 1 (Backend Foundation) - COMPLETE")
-    print("  ✅ Database schema created")
-    print("  ✅ Data manager implemented")
-    print("  ✅ Bot driver implemented")
-    print("  ✅ All modules tested")
-    
-    print("\n⏳ Phase 2 (GUI) - READY FOR DEVELOPMENT")
-    print("  ⏳ PyQt main window")
-    print("  ⏳ Control panel tab")
-    print("  ⏳ Database manager tab")
+    bot_ok = test_bot_driver(config)
     
-    print("\n⏳ Phase 3 (Integration) - WAITING")
-    print("  ⏳ Drag & drop functionality")
-    print("  ⏳ Full automation workflow")
-    print("  ⏳ Threading integration")
+    # Show system status and development phases in one write
+    checks = {'deps': deps_ok, 'config': config, 'db': db_ok, 'dm': dm_ok, 'bot': bot_ok}
+    statuses = {}
+    for name, ok in checks.items():
+        statuses[name] = 'OK' if ok else 'FAILED'
+        statuses[f'{name}_icon'] = STATUS_ICONS[bool(ok)]
+    sys.stdout.write(SYSTEM_STATUS.format_map(statuses))
     
     # Show next steps
     if deps_ok and config and db_ok and dm_ok:
@@ -294,13 +378,8 @@ def main():
         print("  - Database viewer/manager")
         print("  - File drag & drop")
         
-        # Check if we have data
+        # Check if we have data (statistics from check_database)
         try:
-            from data_manager import DataManager
-            dm = DataManager()
-            stats = dm.get_database_stats()
-            dm.close()
-            
             if stats.get('total_products', 0) == 0:
                 print("\n💡 No products found. Import your data:")
                 print("  1. Place Excel file in data/products.xlsx")
@@ -13,29 +13,178 @@ This script will:
 4. Create sample data structure
 """
 
+import functools
 import os
 import sys
 import subprocess
 import json
+from importlib.metadata import version, PackageNotFoundError
 from pathlib import Path
 
+# packaging is optional - without it the requirements precheck is skipped
+# and pip decides what needs installing
+try:
+    from packaging.requirements import Requirement, InvalidRequirement
+    PACKAGING_AVAILABLE = True
+except ImportError:
+    PACKAGING_AVAILABLE = False
+
+# Directories setup makes sure exist, parents first
+DESIRED_DIRS = ('data', 'data/products', 'chrome_profile', 'logs', 'backups')
+
+# Placeholder product folders created under data/products
+SAMPLE_DIRS = tuple(f'data/products/{sku}' for sku in ('SKU001', 'SKU002', 'SKU003'))
+
+SAMPLE_DESCRIPTION = """Sample product description for {sku}
+This is a placeholder description file.
+Replace with actual product descriptions."""
+
+# Written to data/EXCEL_FORMAT.txt
+EXCEL_FORMAT_GUIDE = """
+📋 EXCEL FILE FORMAT EXPECTED:
+
+Your Excel file should have these columns (Hungarian names):
+- Kategória: Main category
+- Kategória 2: Subcategory  
+- Kategória 3: Sub-subcategory
+- Termék kód: Product SKU/Code
+- Terméknév: Product name
+- Méret (cm): Size in cm
+- Részek száma: Number of parts
+- Szín: Color
+- Anyag: Material
+- Vastagság: Thickness
+- Ár: Price (format: "13.990 ; 8990")
+
+Place your Excel file at: data/products.xlsx
+"""
+
+# Files create_sample_data writes when missing, mapped to functions returning their content
+DESIRED_FILES = {
+    **{f'{product_dir}/description.txt':
+           functools.partial(SAMPLE_DESCRIPTION.format, sku=os.path.basename(product_dir))
+       for product_dir in SAMPLE_DIRS},
+    'data/EXCEL_FORMAT.txt': lambda: EXCEL_FORMAT_GUIDE,
+}
+
+# Printed in one write after a successful setup
+NEXT_STEPS = """
+============================================================
+🎉 SHOPBOT SETUP COMPLETE!
+============================================================
+
+📋 NEXT STEPS:
+1️⃣ Place your Excel file at: data/products.xlsx
+2️⃣ Add product images to: data/products/[SKU]/
+3️⃣ Add product descriptions to: data/products/[SKU]/
+4️⃣ Import your data:
+   python -c "from data_manager import DataManager; dm = DataManager(); dm.sync_xlsx_to_db('data/products.xlsx'); dm.scan_and_sync_filesystem('data/products'); dm.close()"
+5️⃣ Test the system:
+   python main.py
+
+🔧 CONFIGURATION:
+- Edit config.json to customize settings
+- Update e-commerce site URLs in config.json
+- Modify bot_driver.py for your specific site
+
+📁 FOLDER STRUCTURE:
+shopbot/
+├── main.py              # Main application
+├── database_setup.py    # Database initialization
+├── data_manager.py      # Data operations
+├── bot_driver.py        # Web automation
+├── config.json          # Configuration
+├── requirements.txt     # Dependencies
+├── products.db          # SQLite database
+└── data/
+    ├── products.xlsx    # Your Excel file (place here)
+    └── products/        # Product folders
+        ├── SKU001/
+        │   ├── image1.jpg
+        │   └── description.txt
+        └── SKU002/
+            └── ...
+"""
+
+def _dir_listing(path):
+    """
+    Lists a directory once.
+    
+    Args:
+        path (str): Directory to list
+        
+    Returns:
+        set: Entry names, empty if the directory doesn't exist
+    """
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+def _ensure_dirs(directories):
+    """
+    Creates whichever of the directories don't exist yet.
+    
+    Each parent directory is listed once and only missing entries are created.
+    Parents must come before their children.
+    
+    Args:
+        directories: Directory paths
+        
+    Returns:
+        set: Paths that were created
+    """
+    listings = {}
+    created = set()
+    
+    for directory in directories:
+        parent, name = os.path.split(directory)
+        parent = parent or '.'
+        if parent not in listings:
+            # A parent created in this pass starts out empty
+            listings[parent] = set() if parent in created else _dir_listing(parent)
+        if name not in listings[parent]:
+            os.makedirs(directory, exist_ok=True)
+            listings[parent].add(name)
+            created.add(directory)
+    
+    return created
+
+def _ensure_files(files):
+    """
+    Writes whichever of the files don't exist yet; existing files are kept.
+    
+    Args:
+        files (dict): Maps file paths to functions returning their content
+        
+    Returns:
+        set: Paths that were written
+    """
+    listings = {}
+    written = set()
+    
+    for path, content in files.items():
+        parent, name = os.path.split(path)
+        parent = parent or '.'
+        if parent not in listings:
+            listings[parent] = _dir_listing(parent)
+        if name not in listings[parent]:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content())
+            written.add(path)
+    
+    return written
+
 def create_directories():
     """
     Creates the necessary directory structure.
     """
     print("📁 Creating directory structure...")
     
-    directories = [
-        'data',
-        'data/products',
-        'chrome_profile',
-        'logs',
-        'backups'
-    ]
-    
-    for directory in directories:
-        os.makedirs(directory, exist_ok=True)
-        print(f"  ✅ Created: {directory}")
+    created = _ensure_dirs(DESIRED_DIRS)
+    for directory in DESIRED_DIRS:
+        print(f"  ✅ {'Created' if directory in created else 'Exists'}: {directory}")
     
     print("✅ Directory structure created")
 
@@ -106,82 +255,113 @@ def create_sample_config():
     
     print("✅ config.json created")
 
+def _requirement_satisfied(line):
+    """
+    Checks one requirements.txt line against the installed packages.
+    
+    Args:
+        line (str): Requirement without comments
+        
+    Returns:
+        bool: True if it is installed in a matching version or doesn't apply
+              to this platform; False if pip should have a look
+    """
+    try:
+        requirement = Requirement(line)
+    except InvalidRequirement:
+        return False
+    if requirement.marker is not None and not requirement.marker.evaluate():
+        return True
+    
+    try:
+        installed = version(requirement.name)
+    except PackageNotFoundError:
+        # Standard library modules listed for old Pythons (asyncio, pathlib)
+        return requirement.name in getattr(sys, 'stdlib_module_names', ())
+    
+    return requirement.specifier.contains(installed, prereleases=True)
+
+def _unmet_requirements(path):
+    """
+    Lists the requirements that are missing or installed in the wrong version.
+    
+    Args:
+        path (str): requirements.txt path
+        
+    Returns:
+        list: Unmet requirement lines, or None if they can't be checked
+              (packaging not installed, or the file can't be read)
+    """
+    if not PACKAGING_AVAILABLE:
+        return None
+    
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = [line.split('#', 1)[0].strip() for line in f]
+    except OSError as e:
+        print(f"⚠️ Could not check {path}: {e}")
+        return None
+    return [line for line in lines if line and not _requirement_satisfied(line)]
+
 def install_dependencies():
     """
     Installs Python dependencies.
+    
+    pip is skipped when every requirement in requirements.txt is already
+    installed; if that can't be checked, the user is asked as usual.
     """
     print("\n📦 Installing dependencies...")
     
-    # Ask user if they want to install dependencies
-    response = input("Install Python dependencies? (y/N): ").lower().strip()
-    
-    if response in ['y', 'yes']:
-        try:
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'])
-            print("✅ Dependencies installed successfully")
-            
-            # Install Playwright browsers
-            response = input("Install Playwright browsers? (y/N): ").lower().strip()
-            if response in ['y', 'yes']:
-                subprocess.check_call([sys.executable, '-m', 'playwright', 'install', 'chromium'])
-                print("✅ Playwright browsers installed")
+    try:
+        unmet = _unmet_requirements('requirements.txt')
+        
+        if unmet == []:
+            print("✅ All dependencies already installed")
+        else:
+            if unmet:
+                print(f"  Missing or outdated: {', '.join(unmet)}")
             
-            return True
+            # Ask user if they want to install dependencies
+            response = input("Install Python dependencies? (y/N): ").lower().strip()
+            if response not in ['y', 'yes']:
+                print("⏭️ Skipping dependency installation")
+                return True
             
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Dependency installation failed: {e}")
-            return False
-    else:
-        print("⏭️ Skipping dependency installation")
+            subprocess.check_call([sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'])
+            print("✅ Dependencies installed successfully")
+        
+        # Install Playwright browsers
+        response = input("Install Playwright browsers? (y/N): ").lower().strip()
+        if response in ['y', 'yes']:
+            subprocess.check_call([sys.executable, '-m', 'playwright', 'install', 'chromium'])
+            print("✅ Playwright browsers installed")
+        
         return True
+        
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Dependency installation failed: {e}")
+        return False
 
 def create_sample_data():
     """
     Creates sample data structure and files.
+    
+    Files that already exist are left untouched.
     """
     print("\n📊 Creating sample data structure...")
     
-    # Create sample product folders
-    sample_skus = ['SKU001', 'SKU002', 'SKU003']
-    
-    for sku in sample_skus:
-        product_dir = f'data/products/{sku}'
-        os.makedirs(product_dir, exist_ok=True)
-        
-        # Create sample description file
-        desc_file = os.path.join(product_dir, 'description.txt')
-        with open(desc_file, 'w', encoding='utf-8') as f:
-            f.write(f"Sample product description for {sku}\n")
-            f.write("This is a placeholder description file.\n")
-            f.write("Replace with actual product descriptions.")
-        
-        print(f"  ✅ Created sample folder: {product_dir}")
-    
-    # Create sample Excel file structure info
-    sample_excel_info = """
-📋 EXCEL FILE FORMAT EXPECTED:
-
-Your Excel file should have these columns (Hungarian names):
-- Kategória: Main category
-- Kategória 2: Subcategory  
-- Kategória 3: Sub-subcategory
-- Termék kód: Product SKU/Code
-- Terméknév: Product name
-- Méret (cm): Size in cm
-- Részek száma: Number of parts
-- Szín: Color
-- Anyag: Material
-- Vastagság: Thickness
-- Ár: Price (format: "13.990 ; 8990")
-
-Place your Excel file at: data/products.xlsx
-"""
+    # Create sample product folders, description files and the Excel format guide
+    created = _ensure_dirs(['data', 'data/products', *SAMPLE_DIRS])
+    written = _ensure_files(DESIRED_FILES)
     
-    with open('data/EXCEL_FORMAT.txt', 'w', encoding='utf-8') as f:
-        f.write(sample_excel_info)
+    for product_dir in SAMPLE_DIRS:
+        print(f"  ✅ {'Created' if product_dir in created else 'Existing'} sample folder: {product_dir}")
     
     print("✅ Sample data structure created")
-    print("📝 Excel format guide created: data/EXCEL_FORMAT.txt")
+    if 'data/EXCEL_FORMAT.txt' in written:
+        print("📝 Excel format guide created: data/EXCEL_FORMAT.txt")
+    else:
+        print("📝 Excel format guide exists: data/EXCEL_FORMAT.txt")
 
 def verify_setup():
     """
@@ -204,10 +384,20 @@ def verify_setup():
         'chrome_profile'
     ]
     
+    # One scandir per parent directory instead of a stat per path
+    listings = {}
+    
+    def exists(path):
+        parent, name = os.path.split(path)
+        parent = parent or '.'
+        if parent not in listings:
+            listings[parent] = _dir_listing(parent)
+        return name in listings[parent]
+    
     # Check files
     missing_files = []
     for file in required_files:
-        if not os.path.exists(file):
+        if not exists(file):
             missing_files.append(file)
         else:
             print(f"  ✅ {file}")
@@ -215,7 +405,7 @@ def verify_setup():
     # Check directories
     missing_dirs = []
     for directory in required_dirs:
-        if not os.path.exists(directory):
+        if not exists(directory):
             missing_dirs.append(directory)
         else:
             print(f"  ✅ {directory}/")
@@ -235,41 +425,7 @@ def show_next_steps():
     """
     Shows the next steps after setup completion.
     """
-    print("\n" + "="*60)
-    print("🎉 SHOPBOT SETUP COMPLETE!")
-    print("="*60)
-    
-    print("\n📋 NEXT STEPS:")
-    print("1️⃣ Place your Excel file at: data/products.xlsx")
-    print("2️⃣ Add product images to: data/products/[SKU]/")
-    print("3️⃣ Add product descriptions to: data/products/[SKU]/")
-    print("4️⃣ Import your data:")
-    print("   python -c \"from data_manager import DataManager; dm = DataManager(); dm.convert_xlsx_to_csv('data/products.xlsx', 'data/products.csv'); dm.sync_csv_to_db('data/products.csv'); dm.scan_and_sync_filesystem('data/products'); dm.close()\"")
-    print("5️⃣ Test the system:")
-    print("   python main.py")
-    
-    print("\n🔧 CONFIGURATION:")
-    print("- Edit config.json to customize settings")
-    print("- Update e-commerce site URLs in config.json")
-    print("- Modify bot_driver.py for your specific site")
-    
-    print("\n📁 FOLDER STRUCTURE:")
-    print("shopbot/")
-    print("├── main.py              # Main application")
-    print("├── database_setup.py    # Database initialization")
-    print("├── data_manager.py      # Data operations")
-    print("├── bot_driver.py        # Web automation")
-    print("├── config.json          # Configuration")
-    print("├── requirements.txt     # Dependencies")
-    print("├── products.db          # SQLite database")
-    print("└── data/")
-    print("    ├── products.xlsx    # Your Excel file (place here)")
-    print("    └── products/        # Product folders")
-    print("        ├── SKU001/")
-    print("        │   ├── image1.jpg")
-    print("        │   └── description.txt")
-    print("        └── SKU002/")
-    print("            └── ...")
+    sys.stdout.write(NEXT_STEPS)
 
 def main():
     """
@@ -298,15 +454,19 @@ def main():
     setup_ok = verify_setup()
     
     # Show results
-    print("\n" + "="*60)
-    print("📊 SETUP SUMMARY")
-    print("="*60)
-    print(f"✅ Directories: Created")
-    print(f"✅ Configuration: Created")
-    print(f"{'✅' if db_ok else '❌'} Database: {'Ready' if db_ok else 'Failed'}")
-    print(f"{'✅' if deps_ok else '⚠️'} Dependencies: {'Installed' if deps_ok else 'Skipped'}")
-    print(f"✅ Sample Data: Created")
-    print(f"{'✅' if setup_ok else '❌'} Verification: {'Passed' if setup_ok else 'Failed'}")
+    sys.stdout.write("\n".join([
+        "",
+        "=" * 60,
+        "📊 SETUP SUMMARY",
+        "=" * 60,
+        "✅ Directories: Created",
+        "✅ Configuration: Created",
+        f"{'✅' if db_ok else '❌'} Database: {'Ready' if db_ok else 'Failed'}",
+        f"{'✅' if deps_ok else '⚠️'} Dependencies: {'Installed' if deps_ok else 'Skipped'}",
+        "✅ Sample Data: Created",
+        f"{'✅' if setup_ok else '❌'} Verification: {'Passed' if setup_ok else 'Failed'}",
+        "",
+    ]))
     
     if setup_ok:
         show_next_steps()
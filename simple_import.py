@@ -5,6 +5,7 @@ Directly imports Excel data without CSV conversion step.
 
 Usage:
     python simple_import.py
+    SHOPBOT_VERBOSE=1 python simple_import.py   # also list every imported product
 
 This script will:
 1. Read your Excel file directly
@@ -12,58 +13,234 @@ This script will:
 3. Import all products into the database
 """
 
+import itertools
+import os
 import pandas as pd
+import queue
+import re
 import sqlite3
-from datetime import datetime
+import threading
+import time
+
+# python-calamine is optional - Rust Excel reader, much faster than openpyxl
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+# List every imported product only when asked to (SHOPBOT_VERBOSE=1); the
+# per-row lines cost more than the insert itself on slow consoles
+VERBOSE = os.environ.get('SHOPBOT_VERBOSE') == '1'
+
+# Spreadsheet rows parsed and inserted per batch, bounding peak memory
+EXCEL_CHUNK_ROWS = 4096
+
+# Parsed batches buffered between the parsing thread and the database writer
+IMPORT_QUEUE_BATCHES = 4
+
+# Category columns joined into category_path, in order
+CATEGORY_COLUMNS = ['Kategória', 'Kategória 2', 'Kategória 3']
+
+# Every spreadsheet column the importer reads; others are never parsed
+IMPORT_COLUMNS = {'Termék kód', 'Terméknév', *CATEGORY_COLUMNS, 'Méret (cm)',
+                  'Részek száma', 'Szín', 'Anyag', 'Vastagság', 'Ár'}
+
+# Everything dropped from a price in one pass: whitespace, thousands dots,
+# and the alternative prices after the first ';'
+PRICE_CLEANUP_RE = re.compile(r'[\s.]|;.*', re.DOTALL)
+
+# Prepared once and rebound for every product by executemany;
+# created_timestamp is filled by its CURRENT_TIMESTAMP column default
+INSERT_SQL = """
+    INSERT INTO products (
+        sku, product_name, category_path, size_cm, parts_count,
+        color, material, thickness, price,
+        is_active, last_modified_timestamp
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
-def parse_price(price_str):
+def cell_text(value):
+    """
+    Converts an Excel cell value to text the way pandas' dtype=str does.
+    Empty cells become None; whole-number floats lose their ".0".
     """
-    Parses price from format "13.990 ; 8990" to extract main price.
+    if value is None or value == '':
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def iter_excel_chunks(excel_path, chunk_rows=EXCEL_CHUNK_ROWS):
+    """
+    Streams the first sheet as DataFrames of up to chunk_rows rows.
+
+    Only the importer's columns are kept, as text. Rows are read with
+    calamine when available, otherwise with openpyxl in read-only mode.
     """
-    if pd.isna(price_str) or not str(price_str).strip():
-        return 0.0
+    workbook = None
+    if CALAMINE_AVAILABLE:
+        rows = CalamineWorkbook.from_path(excel_path).get_sheet_by_index(0).iter_rows()
+    else:
+        import openpyxl
+        workbook = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
 
     try:
-        # Convert to string and clean
-        price_clean = str(price_str).strip()
+        # Header cells may carry stray spaces
+        header = [(cell_text(cell) or '').strip() for cell in next(rows, ())]
+        keep = [i for i, name in enumerate(header) if name in IMPORT_COLUMNS]
+        columns = [header[i] for i in keep]
+
+        while True:
+            chunk = list(itertools.islice(rows, chunk_rows))
+            if not chunk:
+                break
+            yield pd.DataFrame([[cell_text(row[i]) if i < len(row) else None for i in keep]
+                                for row in chunk], columns=columns, dtype=object)
+    finally:
+        if workbook is not None:
+            workbook.close()
+
+def source_column(df, col):
+    """
+    Returns a spreadsheet column, or an all-NaN column if it is missing.
+    """
+    if col in df.columns:
+        return df[col]
+    return pd.Series(float('nan'), index=df.index)
+
+def text_column(df, col):
+    """
+    Returns a column as stripped strings; missing or blank values (and a
+    missing column) become None.
+    """
+    if col not in df.columns:
+        return pd.Series(None, index=df.index, dtype=object)
 
-        # Handle format "13.990 ; 8990" - take first price
-        if ';' in price_clean:
-            price_clean = price_clean.split(';')[0].strip()
+    text = df[col].astype('string').str.strip()
+    text = text.mask(text == '')
+    return text.astype(object).where(text.notna(), None)
 
-        # Remove spaces and convert to float
-        price_clean = price_clean.replace(' ', '').replace('.', '')
+def parse_prices(prices):
+    """
+    Parses prices from format "13.990 ; 8990" to extract main price.
+    """
+    raw = prices.fillna('').astype(str).str.strip()
 
-        return float(price_clean)
+    # "13.990 ; 8990" -> "13990"
+    cleaned = raw.str.replace(PRICE_CLEANUP_RE, '', regex=True)
+    parsed = pd.to_numeric(cleaned, errors='coerce')
 
-    except (ValueError, AttributeError):
+    for price_str in raw[parsed.isna() & (raw != '')]:
         print(f"⚠️ Could not parse price: {price_str}")
-        return 0.0
 
-def build_category_path(row):
+    return parsed.fillna(0.0).astype(float)
+
+def build_category_paths(df):
     """
-    Builds category path from Kategória columns.
+    Builds category paths from Kategória columns.
     """
-    categories = []
+    levels = [text_column(df, col).fillna('') for col in CATEGORY_COLUMNS if col in df.columns]
+    if not levels:
+        return pd.Series('', index=df.index, dtype=object)
 
-    # Check each category column
-    for col in ['Kategória', 'Kategória 2', 'Kategória 3']:
-        if col in row and pd.notna(row[col]) and str(row[col]).strip():
-            categories.append(str(row[col]).strip())
+    # Join the non-empty levels of each row
+    paths = [' > '.join(part for part in parts if part) for parts in zip(*levels)]
+    return pd.Series(paths, index=df.index, dtype=object)
 
-    return ' > '.join(categories) if categories else ''
+def parse_parts_counts(parts):
+    """
+    Parses parts counts from "Részek száma" column.
+    """
+    counts = pd.to_numeric(parts, errors='coerce')
+
+    # Only whole numbers are valid counts
+    return counts.where(counts % 1 == 0).fillna(0).astype('int64')
 
-def parse_parts_count(parts_str):
+def drop_unimportable(df, seen_skus):
     """
-    Parses parts count from "Részek száma" column.
+    Drops rows without a product code, and rows repeating a code already
+    seen in this import (seen_skus is updated with the new codes).
+
+    Returns the remaining rows and the list of duplicate codes.
     """
-    if pd.isna(parts_str):
-        return 0
+    df = df.assign(sku=text_column(df, 'Termék kód'))
+    df = df[df['sku'].notna()]
+
+    duplicates = df['sku'].duplicated() | df['sku'].isin(seen_skus)
+    seen_skus.update(df.loc[~duplicates, 'sku'])
+    return df[~duplicates], list(df.loc[duplicates, 'sku'])
 
+def build_rows(df, timestamp):
+    """
+    Maps the spreadsheet DataFrame to INSERT_SQL parameter tuples.
+
+    The batch is built here, on the parsing thread, so the writer's
+    executemany only has to bind the finished tuples.
+    """
+    return list(zip(
+        df['sku'],
+        text_column(df, 'Terméknév').fillna(''),  # NOT NULL
+        build_category_paths(df),
+        text_column(df, 'Méret (cm)'),
+        parse_parts_counts(source_column(df, 'Részek száma')),
+        text_column(df, 'Szín'),
+        text_column(df, 'Anyag'),
+        text_column(df, 'Vastagság'),
+        parse_prices(source_column(df, 'Ár')),
+        itertools.repeat(1),  # is_active
+        itertools.repeat(timestamp),
+    ))
+
+def put_batch(batches, item, stop):
+    """
+    Puts item on the queue, giving up once stop is set. Returns whether it
+    was put.
+    """
+    while not stop.is_set():
+        try:
+            batches.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+def produce_batches(excel_path, timestamp, batches, stop):
+    """
+    Parses the sheet on a worker thread while the main thread writes to the
+    database. Puts one (columns, sheet row count, rows, duplicates) batch per
+    chunk, then None - or the exception that stopped parsing.
+    """
+    seen_skus = set()
     try:
-        return int(str(parts_str).strip())
-    except (ValueError, AttributeError):
-        return 0
+        for df in iter_excel_chunks(excel_path):
+            columns, total = list(df.columns), len(df)
+
+            # A product code can only be imported once - later duplicates are errors
+            df, duplicates = drop_unimportable(df, seen_skus)
+
+            # Parse every field as a whole column
+            if not put_batch(batches, (columns, total, build_rows(df, timestamp), duplicates), stop):
+                return
+        item = None
+    except Exception as e:
+        item = e
+    put_batch(batches, item, stop)
+
+def drop_secondary_indexes(cursor):
+    """
+    Drops the products indexes created by database_setup.py and returns
+    their CREATE statements so they can be rebuilt after the load.
+
+    The UNIQUE(sku) index belongs to the table and always stays.
+    """
+    cursor.execute("SELECT name, sql FROM sqlite_master "
+                   "WHERE type = 'index' AND tbl_name = 'products' AND sql IS NOT NULL")
+    indexes = cursor.fetchall()
+    for name, _ in indexes:
+        cursor.execute(f'DROP INDEX "{name}"')
+    return [sql for _, sql in indexes]
 
 def main():
     print("📊 ShopBot Simple Import")
@@ -72,70 +249,92 @@ def main():
     # Check if Excel file exists
     excel_path = 'data/products.xlsx'
     try:
-        # Read Excel file
-        print(f"📋 Reading Excel file: {excel_path}")
-        df = pd.read_excel(excel_path, engine='openpyxl')
-
-        # Clean column names
-        df.columns = df.columns.str.strip()
+        if not os.path.exists(excel_path):
+            raise FileNotFoundError(excel_path)
 
-        print(f"✅ Read {len(df)} rows from Excel")
-        print(f"📋 Columns found: {list(df.columns)}")
-
-        # Connect to database
-        conn = sqlite3.connect('products.db')
+        # Connect to database; the transaction is opened explicitly with BEGIN
+        conn = sqlite3.connect('products.db', isolation_level=None)
         cursor = conn.cursor()
 
-        # Clear existing data
-        cursor.execute("DELETE FROM products")
-        print("🗑️ Cleared existing products from database")
-
-        # Process each row
+        # One-shot bulk load: the table is wiped and rebuilt from the Excel file,
+        # so a crash mid-import loses nothing that a rerun can't restore. Skip
+        # fsyncs and keep the rollback journal in memory.
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+
+        # Every product in this import shares one modification time (Unix time)
+        timestamp = int(time.time())
+        total_rows = 0
         processed = 0
         errors = 0
 
-        for index, row in df.iterrows():
+        # Replace all products in a single transaction, streaming the sheet in batches
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            # No WHERE clause, no triggers and foreign keys left off, so SQLite
+            # drops the tables' pages wholesale instead of deleting row by row.
+            # Image rows point at the old product ids, so they go as well (the
+            # ON DELETE CASCADE only runs with foreign keys on).
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'product_images'")
+            if cursor.fetchone():
+                cursor.execute("DELETE FROM product_images")
+            cursor.execute("DELETE FROM products")
+            print("🗑️ Cleared existing products from database")
+
+            # Build the secondary indexes once after the load instead of
+            # updating them for every inserted row
+            index_sql = drop_secondary_indexes(cursor)
+
+            print(f"📋 Reading Excel file: {excel_path}")
+            batches = queue.Queue(maxsize=IMPORT_QUEUE_BATCHES)
+            stop = threading.Event()
+            producer = threading.Thread(target=produce_batches, daemon=True,
+                                        args=(excel_path, timestamp, batches, stop))
+            producer.start()
             try:
-                # Skip rows without product code
-                if pd.isna(row.get('Termék kód', '')) or not str(row['Termék kód']).strip():
-                    continue
-
-                # Map data
-                sku = str(row['Termék kód']).strip()
-                product_name = str(row.get('Terméknév', '')).strip()
-                category_path = build_category_path(row)
-                size_cm = str(row.get('Méret (cm)', '')).strip()
-                parts_count = parse_parts_count(row.get('Részek száma'))
-                color = str(row.get('Szín', '')).strip()
-                material = str(row.get('Anyag', '')).strip()
-                thickness = str(row.get('Vastagság', '')).strip()
-                price = parse_price(row.get('Ár'))
-
-                # Insert into database
-                cursor.execute("""
-                    INSERT INTO products (
-                        sku, product_name, category_path, size_cm, parts_count,
-                        color, material, thickness, price,
-                        is_active, created_timestamp, last_modified_timestamp
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    sku, product_name, category_path, size_cm, parts_count,
-                    color, material, thickness, price,
-                    1,  # is_active
-                    datetime.now().isoformat(),
-                    datetime.now().isoformat()
-                ))
-
-                processed += 1
-                print(f"  ✅ {sku}: {product_name}")
-
-            except Exception as e:
-                errors += 1
-                print(f"  ❌ Error processing row {index + 1}: {e}")
-                continue
-
-        # Commit changes
-        conn.commit()
+                while True:
+                    batch = batches.get()
+                    if batch is None:
+                        break
+                    if isinstance(batch, Exception):
+                        raise batch
+
+                    columns, total, rows, duplicates = batch
+                    if total_rows == 0:
+                        print(f"📋 Columns found: {columns}")
+                    total_rows += total
+
+                    errors += len(duplicates)
+                    for sku in duplicates:
+                        print(f"  ❌ Duplicate product code: {sku}")
+
+                    # The next chunk is parsed while this one is inserted
+                    cursor.executemany(INSERT_SQL, rows)
+                    processed += len(rows)
+
+                    if VERBOSE and rows:
+                        print("\n".join(f"  ✅ {row[0]}: {row[1]}" for row in rows))
+            finally:
+                stop.set()
+                producer.join()
+
+            for sql in index_sql:
+                cursor.execute(sql)
+            cursor.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+
+        # Return the pages the old rows left free (databases from
+        # database_setup.py use auto_vacuum=INCREMENTAL; a no-op otherwise).
+        # executescript steps the pragma to completion - execute() would only
+        # free a single page.
+        conn.executescript("PRAGMA incremental_vacuum")
+
+        print(f"✅ Read {total_rows} rows from Excel")
 
         # Show results
         print(f"\n📊 Import Results:")
@@ -174,6 +373,7 @@ def main():
         print(f"❌ Import failed: {e}")
         print("Make sure you have pandas and openpyxl installed:")
         print("  pip install pandas openpyxl")
+        print("Optional (faster): pip install python-calamine")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""
+Tests for DataManager's CSV sync.
+
+Usage:
+    python -m pytest test_data_manager.py
+"""
+
+from database_setup import create_database
+from data_manager import DataManager
+
+CSV_HEADER = "Termék kód,Terméknév,Ár\n"
+
+
+def test_failed_csv_sync_releases_transaction(tmp_path, monkeypatch):
+    """A CSV that fails to parse mid-sync must not leave the transaction open."""
+    monkeypatch.chdir(tmp_path)
+    assert create_database()
+
+    good_csv = tmp_path / "good.csv"
+    good_csv.write_text(CSV_HEADER + "SKU1,Szék,2500\n", encoding='utf-8')
+    bad_csv = tmp_path / "bad.csv"
+    # Unterminated quote past the parser's first buffer: the header read
+    # succeeds and the body fails only once the sync transaction is open
+    good_rows = "".join(f"BULK{i},Asztal,1000\n" for i in range(50_000))
+    bad_csv.write_text(CSV_HEADER + good_rows + 'BAD,"Asztal,1000\n', encoding='utf-8')
+
+    def product_rows():
+        return [tuple(row) for row in dm.connection.execute(
+            "SELECT sku, product_name, price FROM products ORDER BY sku")]
+
+    dm = DataManager("products.db")
+    try:
+        assert dm.sync_csv_to_db(str(good_csv)) == 1
+        assert product_rows() == [('SKU1', 'Szék', 2500)]
+
+        assert dm.sync_csv_to_db(str(bad_csv)) == 0
+        assert not dm.connection.in_transaction
+        assert product_rows() == [('SKU1', 'Szék', 2500)]
+
+        # The connection is still usable for the next sync
+        assert dm.sync_csv_to_db(str(good_csv)) == 1
+        assert dm.get_database_stats()['total_products'] == 1
+    finally:
+        dm.close()